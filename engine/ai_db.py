@@ -59,12 +59,28 @@ def get_db_path(runtime_dir: Path) -> Path:
     return runtime_dir / "ai.db"
 
 
+# Per-connection tuning; same trade-offs as memory_core.store_sqlite's
+# _CONNECTION_PRAGMAS (see the durability note there).
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+"""
+
+
+def _open(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(str(db_path))
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_CONNECTION_PRAGMAS)
+    return conn
+
+
 def create_db(runtime_dir: Path) -> sqlite3.Connection:
     """Create the SQLite database and schema."""
     db_path = get_db_path(runtime_dir)
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(db_path))
-    conn.row_factory = sqlite3.Row
+    conn = _open(db_path)
     conn.executescript(SCHEMA_SQL)
     conn.commit()
     return conn
@@ -75,109 +91,133 @@ def connect_db(runtime_dir: Path) -> sqlite3.Connection:
     db_path = get_db_path(runtime_dir)
     if not db_path.exists():
         return create_db(runtime_dir)
-    conn = sqlite3.connect(str(db_path))
+    return _open(db_path)
+
+
+def connect_db_readonly(runtime_dir: Path) -> sqlite3.Connection:
+    """Open the DB read-only for export-style scans (creates it if missing)."""
+    db_path = get_db_path(runtime_dir)
+    if not db_path.exists():
+        return create_db(runtime_dir)
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
 
-def ingest_team(conn: sqlite3.Connection, team_data: dict):
-    """Ingest team.yaml data into the workers table."""
-    conn.execute("DELETE FROM workers")
+def remove_db(runtime_dir: Path):
+    """Delete the DB along with its WAL sidecar files."""
+    db_path = get_db_path(runtime_dir)
+    for suffix in ("", "-wal", "-shm"):
+        path = db_path.with_name(db_path.name + suffix)
+        if path.exists():
+            path.unlink()
+
+
+_WORKER_INSERT = (
+    "INSERT OR REPLACE INTO workers (id, role_id, title, department, provider, model, reports_to, authority) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def _worker_rows(team_data: dict):
     orch = team_data.get("orchestrator", {})
-    conn.execute(
-        "INSERT OR REPLACE INTO workers (id, role_id, title, department, provider, model, reports_to, authority) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-        (
-            orch.get("role_id", "orchestrator"),
-            orch.get("role_id", "orchestrator"),
-            orch.get("title", "Orchestrator"),
-            "orchestration",
-            None,
-            None,
-            None,
-            orch.get("authority", "write"),
-        ),
+    yield (
+        orch.get("role_id", "orchestrator"),
+        orch.get("role_id", "orchestrator"),
+        orch.get("title", "Orchestrator"),
+        "orchestration",
+        None,
+        None,
+        None,
+        orch.get("authority", "write"),
     )
     for role in team_data.get("roles", []):
         for worker in role.get("workers", []):
-            conn.execute(
-                "INSERT OR REPLACE INTO workers (id, role_id, title, department, provider, model, reports_to, authority) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    worker.get("id", role["role_id"]),
-                    role["role_id"],
-                    role.get("title", ""),
-                    role.get("department", ""),
-                    worker.get("provider", ""),
-                    worker.get("model", ""),
-                    role.get("reports_to", ""),
-                    role.get("authority", "read"),
-                ),
+            yield (
+                worker.get("id", role["role_id"]),
+                role["role_id"],
+                role.get("title", ""),
+                role.get("department", ""),
+                worker.get("provider", ""),
+                worker.get("model", ""),
+                role.get("reports_to", ""),
+                role.get("authority", "read"),
             )
         if not role.get("workers"):
-            conn.execute(
-                "INSERT OR REPLACE INTO workers (id, role_id, title, department, provider, model, reports_to, authority) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    role["role_id"],
-                    role["role_id"],
-                    role.get("title", ""),
-                    role.get("department", ""),
-                    None,
-                    None,
-                    role.get("reports_to", ""),
-                    role.get("authority", "read"),
-                ),
+            yield (
+                role["role_id"],
+                role["role_id"],
+                role.get("title", ""),
+                role.get("department", ""),
+                None,
+                None,
+                role.get("reports_to", ""),
+                role.get("authority", "read"),
             )
-    conn.commit()
 
 
-def ingest_board(conn: sqlite3.Connection, board_data: dict):
+def ingest_team(conn: sqlite3.Connection, team_data: dict, commit: bool = True):
+    """Ingest team.yaml data into the workers table."""
+    conn.execute("DELETE FROM workers")
+    conn.executemany(_WORKER_INSERT, _worker_rows(team_data))
+    if commit:
+        conn.commit()
+
+
+def ingest_board(conn: sqlite3.Connection, board_data: dict, commit: bool = True):
     """Ingest board.yaml data into the tasks table."""
     conn.execute("DELETE FROM tasks")
     from datetime import datetime, timezone
 
     now = datetime.now(timezone.utc).isoformat()
-    for task in board_data.get("tasks", []):
-        approvals = task.get("requires_approval", [])
-        conn.execute(
-            "INSERT OR REPLACE INTO tasks (id, title, status, owner_role, requires_approval_json, updated_ts) "
-            "VALUES (?, ?, ?, ?, ?, ?)",
+    conn.executemany(
+        "INSERT OR REPLACE INTO tasks (id, title, status, owner_role, requires_approval_json, updated_ts) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
             (
                 task["id"],
                 task["title"],
                 task["status"],
                 task.get("owner_role", ""),
-                json.dumps(approvals),
+                json.dumps(task.get("requires_approval", [])),
                 now,
-            ),
-        )
-    conn.commit()
+            )
+            for task in board_data.get("tasks", [])
+        ),
+    )
+    if commit:
+        conn.commit()
 
 
-def ingest_approvals(conn: sqlite3.Connection, approvals_data: dict):
+def ingest_approvals(conn: sqlite3.Connection, approvals_data: dict, commit: bool = True):
     """Ingest approvals.yaml approval_log into the approvals table."""
     conn.execute("DELETE FROM approvals")
-    for entry in approvals_data.get("approval_log", []):
-        conn.execute(
-            "INSERT INTO approvals (task_id, approval_type, status, approved_by, ts) "
-            "VALUES (?, ?, ?, ?, ?)",
+    conn.executemany(
+        "INSERT INTO approvals (task_id, approval_type, status, approved_by, ts) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (
             (
                 entry.get("task_id", ""),
                 entry.get("approval_type", entry.get("trigger_id", "")),
                 entry.get("status", "pending"),
                 entry.get("approved_by", ""),
                 entry.get("timestamp", ""),
-            ),
-        )
-    conn.commit()
+            )
+            for entry in approvals_data.get("approval_log", [])
+        ),
+    )
+    if commit:
+        conn.commit()
 
 
-def set_snapshot(conn: sqlite3.Connection, key: str, value: str):
+def set_snapshot(conn: sqlite3.Connection, key: str, value: str, commit: bool = True):
     conn.execute(
         "INSERT OR REPLACE INTO snapshots (key, value) VALUES (?, ?)", (key, value)
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_snapshot(conn: sqlite3.Connection, key: str) -> str | None:
@@ -187,7 +227,14 @@ def get_snapshot(conn: sqlite3.Connection, key: str) -> str | None:
     return row["value"] if row else None
 
 
-def add_event(conn: sqlite3.Connection, actor: str, event_type: str, payload: dict | None = None):
+def add_event(
+    conn: sqlite3.Connection,
+    actor: str,
+    event_type: str,
+    payload: dict | None = None,
+    commit: bool = True,
+):
+    """Append an event. Pass commit=False to batch several writes in one transaction."""
     from datetime import datetime, timezone
 
     conn.execute(
@@ -199,7 +246,8 @@ def add_event(conn: sqlite3.Connection, actor: str, event_type: str, payload: di
             json.dumps(payload) if payload else None,
         ),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def export_events(conn: sqlite3.Connection) -> list[dict]:
@@ -221,17 +269,18 @@ def export_derived(conn: sqlite3.Connection) -> dict:
 
 
 def import_events(conn: sqlite3.Connection, events: list[dict]):
-    for ev in events:
-        payload = ev.get("payload")
-        conn.execute(
-            "INSERT INTO events (ts, actor, type, payload_json) VALUES (?, ?, ?, ?)",
+    conn.executemany(
+        "INSERT INTO events (ts, actor, type, payload_json) VALUES (?, ?, ?, ?)",
+        (
             (
                 ev["ts"],
                 ev["actor"],
                 ev["type"],
-                json.dumps(payload) if payload else None,
-            ),
-        )
+                json.dumps(ev["payload"]) if ev.get("payload") else None,
+            )
+            for ev in events
+        ),
+    )
     conn.commit()
 
 
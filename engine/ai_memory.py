@@ -14,9 +14,28 @@ import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import ai_db, ai_state
 
 
+# JSONL codec for pack events: orjson when installed, stdlib json otherwise.
+# Both directions work on bytes, so the files are read and written in binary.
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _jsonl_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    _loads = json.loads
+
+    def _jsonl_line(obj) -> bytes:
+        return (json.dumps(obj) + "\n").encode("utf-8")
+
+
 def export_memory(
     ai_dir: Path,
     runtime_dir: Path,
@@ -31,7 +50,7 @@ def export_memory(
     pack_dir = runtime_dir / "memory_pack_cache" / f"memory_pack_{ts}"
     pack_dir.mkdir(parents=True, exist_ok=True)
 
-    conn = ai_db.connect_db(runtime_dir)
+    conn = ai_db.connect_db_readonly(runtime_dir)
 
     # Compute canonical hash
     canonical_hash = ai_state.compute_canonical_hash(ai_dir)
@@ -64,9 +83,8 @@ def export_memory(
 
     # Write events as JSONL
     events = ai_db.export_events(conn)
-    with open(pack_dir / "events.jsonl", "w") as f:
-        for ev in events:
-            f.write(json.dumps(ev) + "\n")
+    with open(pack_dir / "events.jsonl", "wb") as f:
+        f.writelines(_jsonl_line(ev) for ev in events)
 
     # Write derived state
     derived = ai_db.export_derived(conn)
@@ -124,7 +142,7 @@ def import_memory(
     if not manifest_path.exists():
         return "Error: No manifest.json found in memory pack."
 
-    manifest = json.loads(manifest_path.read_text())
+    manifest = _loads(manifest_path.read_bytes())
     if manifest.get("version") != "1.0":
         return f"Error: Unsupported memory pack version: {manifest.get('version')}"
 
@@ -135,11 +153,11 @@ def import_memory(
     imported_count = 0
     if events_path.exists():
         events = []
-        with open(events_path) as f:
+        with open(events_path, "rb") as f:
             for line in f:
                 line = line.strip()
                 if line:
-                    events.append(json.loads(line))
+                    events.append(_loads(line))
         ai_db.import_events(conn, events)
         imported_count = len(events)
 
@@ -148,7 +166,7 @@ def import_memory(
     derived_imported = False
     if derived_path.exists():
         try:
-            derived = json.loads(derived_path.read_text())
+            derived = _loads(derived_path.read_bytes())
             # Only import derived if canonical hash matches (schema compatible)
             current_hash = ai_state.compute_canonical_hash(ai_dir)
             if manifest.get("canonical_hash") == current_hash:
@@ -14,6 +14,7 @@ from pathlib import Path
 
 from . import ai_db, ai_git, ai_init, ai_memory, ai_state, ai_validate
 from . import ai_intents, ai_scope, ai_persistence, ai_recovery
+from .guard import clear_submodule_cache
 
 
 def _load_adapter_data(project_root: Path) -> dict | None:
@@ -86,12 +87,10 @@ def handle_rehydrate_db(project_root: Path, **kwargs) -> str:
     ai_dir = project_root / ".ai"
     runtime_dir = project_root / ".ai_runtime"
 
-    # Delete existing DB and rebuild
-    db_path = ai_db.get_db_path(runtime_dir)
-    if db_path.exists():
-        db_path.unlink()
+    # Delete existing DB (and any WAL sidecars) and rebuild
+    ai_db.remove_db(runtime_dir)
 
-    ai_db.create_db(runtime_dir)
+    ai_db.create_db(runtime_dir).close()
     updated = ai_state.reconcile(ai_dir, runtime_dir)
     return "Database rehydrated from canonical YAML state."
 
@@ -580,6 +579,9 @@ def dispatch_command(project_root: Path, command: str, **kwargs) -> str:
     2. Intent router (natural language → handler via intents.yaml)
     3. Command registry (commands.yaml alias lookup)
     """
+    # Each command is a new write batch: drop write-guard answers memoized
+    # against a filesystem layout that may have changed since the last one.
+    clear_submodule_cache()
     scope_warning = ""
 
     # 1. Scope gate
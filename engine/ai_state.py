@@ -94,32 +94,43 @@ def save_canonical(ai_dir: Path, state: dict):
         _save_yaml(state_dir / "commands.yaml", state["commands"])
 
 
-def reconcile(ai_dir: Path, runtime_dir: Path) -> bool:
+def reconcile(ai_dir: Path, runtime_dir: Path, conn=None) -> bool:
     """Reconcile canonical YAML with SQLite DB.
 
+    If ``conn`` is given it is used as-is and left open for the caller;
+    otherwise a connection is opened and closed here.
+
     Returns True if DB was updated, False if already in sync.
     """
-    conn = ai_db.connect_db(runtime_dir)
+    owns_conn = conn is None
+    if owns_conn:
+        conn = ai_db.connect_db(runtime_dir)
+    try:
+        return _reconcile(conn, ai_dir)
+    finally:
+        if owns_conn:
+            conn.close()
+
+
+def _reconcile(conn, ai_dir: Path) -> bool:
     current_hash = compute_canonical_hash(ai_dir)
     stored_hash = ai_db.get_snapshot(conn, "canonical_hash")
 
     if stored_hash == current_hash:
-        conn.close()
         return False
 
-    # Canonical changed (or first run) — re-ingest
+    # Canonical changed (or first run) — re-ingest in a single transaction
     state = load_canonical(ai_dir)
-    ai_db.ingest_team(conn, state["team"])
-    ai_db.ingest_board(conn, state["board"])
-    ai_db.ingest_approvals(conn, state["approvals"])
+    ai_db.ingest_team(conn, state["team"], commit=False)
+    ai_db.ingest_board(conn, state["board"], commit=False)
+    ai_db.ingest_approvals(conn, state["approvals"], commit=False)
 
     from datetime import datetime, timezone
 
-    ai_db.set_snapshot(conn, "canonical_hash", current_hash)
-    ai_db.set_snapshot(conn, "last_ingested_ts", datetime.now(timezone.utc).isoformat())
-    ai_db.add_event(conn, "system", "reconcile", {"hash": current_hash})
-
-    conn.close()
+    ai_db.set_snapshot(conn, "canonical_hash", current_hash, commit=False)
+    ai_db.set_snapshot(conn, "last_ingested_ts", datetime.now(timezone.utc).isoformat(), commit=False)
+    ai_db.add_event(conn, "system", "reconcile", {"hash": current_hash}, commit=False)
+    conn.commit()
     return True
 
 
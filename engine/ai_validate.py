@@ -7,6 +7,7 @@ Validates .ai/state/*.yaml against JSON schemas under schemas/.
 from __future__ import annotations
 
 import json
+import subprocess
 from pathlib import Path
 
 try:
@@ -14,6 +15,8 @@ try:
 except ImportError:
     yaml = None
 
+from .guard import detect_submodule_paths
+from .help.builder import _build_prompt_categories, _load_capabilities
 from .submodule_paths import (
     CANONICAL_SUBMODULE_PATH,
     LEGACY_SUBMODULE_PATH,
@@ -33,6 +36,46 @@ def _load_yaml(path: Path) -> dict:
     )
 
 
+# Local cache of files that last validated cleanly, keyed by YAML path.
+# Lives in .ai_runtime/ (never committed) rather than alongside canonical state.
+VALIDATED_MARKER = "validated.json"
+
+
+def _load_validated_marker(marker_path: Path) -> dict:
+    try:
+        return json.loads(marker_path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _file_stamp(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _validate_file_cached(
+    yaml_path: Path,
+    schema_path: Path,
+    known_good: dict,
+    still_good: dict,
+) -> list[str]:
+    """Validate yaml_path unless it and its schema are unchanged since known_good.
+
+    The stamp records the schema path plus mtime and size of both files, so
+    swapping in a different schema (even an older one) forces revalidation.
+    Clean results are recorded in still_good so the marker can be rewritten.
+    """
+    key = str(yaml_path)
+    stamp = [str(schema_path), *_file_stamp(yaml_path), *_file_stamp(schema_path)]
+    if known_good.get(key) == stamp:
+        still_good[key] = stamp
+        return []
+    errors = validate_file(yaml_path, schema_path)
+    if not errors:
+        still_good[key] = stamp
+    return errors
+
+
 def _load_schema(schema_path: Path) -> dict:
     return json.loads(schema_path.read_text())
 
@@ -107,12 +150,9 @@ def validate_submodule_integrity(project_root: Path) -> list[str]:
 
     Returns list of error messages (empty = clean).
     """
-    from .guard import detect_submodule_paths
-
     errors: list[str] = []
     for sub_path in detect_submodule_paths(project_root):
         try:
-            import subprocess
             result = subprocess.run(
                 ["git", "status", "--porcelain"],
                 cwd=str(sub_path),
@@ -174,11 +214,16 @@ def validate_all(
     ai_dir: Path,
     schemas_dir: Path,
     project_root: Path | None = None,
+    force: bool = False,
 ) -> dict[str, list[str]]:
     """Validate all canonical YAML files against their schemas.
 
     Also checks submodule integrity if project_root is provided.
 
+    Files whose YAML and schema mtimes match the last clean run recorded in
+    .ai_runtime/validated.json are skipped. Pass force=True to revalidate
+    everything (e.g. in CI).
+
     Returns {filename: [errors]} dict.
     """
     # Required files (must exist)
@@ -198,6 +243,10 @@ def validate_all(
         "project.yaml": "project.schema.json",
     }
 
+    marker_path = ai_dir.parent / ".ai_runtime" / VALIDATED_MARKER
+    known_good = {} if force else _load_validated_marker(marker_path)
+    still_good: dict[str, list] = {}
+
     results = {}
     for yaml_name, schema_name in required_mapping.items():
         yaml_path = ai_dir / "state" / yaml_name
@@ -208,7 +257,7 @@ def validate_all(
         if not schema_path.exists():
             results[yaml_name] = [f"Schema not found: {schema_path}"]
             continue
-        results[yaml_name] = validate_file(yaml_path, schema_path)
+        results[yaml_name] = _validate_file_cached(yaml_path, schema_path, known_good, still_good)
 
     for yaml_name, schema_name in optional_mapping.items():
         yaml_path = ai_dir / "state" / yaml_name
@@ -218,7 +267,7 @@ def validate_all(
         if not schema_path.exists():
             results[yaml_name] = []  # File exists but no schema yet — pass
             continue
-        results[yaml_name] = validate_file(yaml_path, schema_path)
+        results[yaml_name] = _validate_file_cached(yaml_path, schema_path, known_good, still_good)
 
     # Submodule integrity check
     if project_root is not None:
@@ -261,10 +310,19 @@ def validate_all(
     if core_truths_path.exists():
         truths_schema = schemas_dir / "core_truths.schema.json"
         if truths_schema.exists():
-            results["core_truths.yaml"] = validate_file(core_truths_path, truths_schema)
+            results["core_truths.yaml"] = _validate_file_cached(
+                core_truths_path, truths_schema, known_good, still_good,
+            )
         else:
             results["core_truths.yaml"] = []
 
+    # Only persist the marker where a runtime dir already exists
+    if still_good != known_good and marker_path.parent.is_dir():
+        try:
+            marker_path.write_text(json.dumps(still_good, indent=2))
+        except OSError:
+            pass
+
     return results
 
 
@@ -291,7 +349,6 @@ def validate_capabilities_consistency(ai_dir: Path) -> list[str]:
     worker_cfg = caps.get("worker_bees", {})
     if worker_cfg.get("supported"):
         # Verify the help builder would include worker bees
-        from .help.builder import _load_capabilities, _build_prompt_categories
         loaded = _load_capabilities(ai_dir)
         categories = _build_prompt_categories(loaded)
         bee_cats = [c for c in categories if "Worker" in c.name or "Bee" in c.name]
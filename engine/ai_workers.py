@@ -18,11 +18,18 @@ import re
 from datetime import datetime, timezone
 from pathlib import Path
 
+from . import ai_init, ai_providers
+
 try:
     import yaml
 except ImportError:
     yaml = None  # type: ignore[assignment]
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # type: ignore[assignment]
+
 
 # Provider registry is now loaded from providers.yaml via ai_providers module.
 # See engine/ai_providers.py for the extensible provider registry.
@@ -60,6 +67,37 @@ ROLE_KEYWORDS = [
     ("content", "content_writer"),
 ]
 
+
+def _build_role_automaton():
+    """Build an Aho-Corasick automaton over ROLE_KEYWORDS (None if unavailable).
+
+    Each keyword maps to (rank, role_id), where rank is its position in
+    ROLE_KEYWORDS, so picking the lowest rank among all hits reproduces the
+    longest-first ordering of the linear scan in a single pass.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for rank, (keyword, rid) in enumerate(ROLE_KEYWORDS):
+        automaton.add_word(keyword, (rank, rid))
+    automaton.make_automaton()
+    return automaton
+
+
+_ROLE_AUTOMATON = _build_role_automaton()
+
+
+def _match_role_keyword(phrase: str) -> str | None:
+    """Return the role_id of the highest-priority keyword found in phrase."""
+    if _ROLE_AUTOMATON is not None:
+        best = min((value for _end, value in _ROLE_AUTOMATON.iter(phrase)), default=None)
+        return best[1] if best else None
+    for keyword, rid in ROLE_KEYWORDS:
+        if keyword in phrase:
+            return rid
+    return None
+
+
 ROLE_TITLES = {
     "developer": "Developer",
     "reviewer": "Code Reviewer",
@@ -87,7 +125,6 @@ ROLE_DEPARTMENTS = {
 
 def _get_default_model(provider_name: str, project_root: Path) -> str:
     """Get default model for a provider via the provider registry."""
-    from . import ai_providers
     return ai_providers.get_default_model(provider_name, project_root)
 
 
@@ -101,8 +138,6 @@ def parse_team_spec(text: str, project_root: Path | None = None) -> list[dict]:
 
     Returns list of role dicts ready for team.yaml.
     """
-    from . import ai_providers
-
     # Build dynamic provider name list from registry
     alias_map = ai_providers.build_provider_alias_map(project_root) if project_root else {}
     if alias_map:
@@ -142,11 +177,7 @@ def parse_team_spec(text: str, project_root: Path | None = None) -> list[dict]:
 
         # Resolve role (check longest keywords first)
         role_words_clean = role_words.strip().rstrip("s").lower()
-        role_id = None
-        for keyword, rid in ROLE_KEYWORDS:
-            if keyword in role_words_clean:
-                role_id = rid
-                break
+        role_id = _match_role_keyword(role_words_clean)
         if not role_id:
             role_id = role_words_clean.replace(" ", "_")
 
@@ -199,7 +230,8 @@ def apply_team_spec(project_root: Path, roles: list[dict]) -> str:
     team_path.parent.mkdir(parents=True, exist_ok=True)
     team_path.write_text(yaml.dump(team_data, default_flow_style=False, sort_keys=False))
 
-    total_workers = sum(len(r.get("workers", [])) for r in roles)
+    # parse_team_spec always sets "workers", but hand-built roles may omit it
+    total_workers = sum(len(r["workers"]) for r in roles if "workers" in r)
     return (
         f"Team configured: {len(roles)} role(s), {total_workers} worker(s).\n"
         f"Written to: {team_path}\n"
@@ -273,7 +305,6 @@ def _load_prompt_template(project_root: Path) -> str:
         return project_template.read_text()
 
     # Check skeleton templates
-    from . import ai_init
     skeleton_dir = ai_init.find_skeleton_dir()
     skeleton_template = skeleton_dir / "templates" / ".ai" / "prompts" / "role_templates" / "role_base.md"
     if skeleton_template.exists():
@@ -324,8 +355,6 @@ def spawn_workers(project_root: Path, force: bool = False) -> str:
 
     lines = [f"Spawning {len(workers)} worker(s):\n"]
 
-    from . import ai_providers
-
     for w in workers:
         cli = ai_providers.get_cli_command(w["provider"], project_root)
         model_arg = ai_providers.get_model_arg(w["provider"], project_root)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -282,42 +283,64 @@ COMMAND_SPECS: tuple[CliCommandSpec, ...] = (
 )
 
 
+# COMMAND_SPECS is immutable, so help output derived from it is built once.
+_HELP_WIDTH = max(len(spec.help_spec) for spec in COMMAND_SPECS)
+_HELP_LINES: tuple[str, ...] = tuple(
+    f"  {spec.help_spec.ljust(_HELP_WIDTH)}  {spec.help_description}"
+    for spec in COMMAND_SPECS
+)
+_HELP_JSON: tuple[dict[str, str], ...] = tuple(
+    {
+        "name": spec.cli_name,
+        "description": spec.json_description,
+        "example": spec.json_example,
+    }
+    for spec in COMMAND_SPECS
+)
+_IMPLEMENTED_NAMES: frozenset[str] = frozenset(spec.cli_name for spec in COMMAND_SPECS)
+
+
 def cli_help_command_lines() -> list[str]:
     """Return aligned command lines for the CLI help output."""
-    width = max(len(spec.help_spec) for spec in COMMAND_SPECS)
-    return [
-        f"  {spec.help_spec.ljust(width)}  {spec.help_description}"
-        for spec in COMMAND_SPECS
-    ]
+    return list(_HELP_LINES)
+
 
+def help_json_commands() -> tuple[dict[str, str], ...]:
+    """Return help --json command entries from the shared registry.
 
-def help_json_commands() -> list[dict[str, str]]:
-    """Return help --json command entries from the shared registry."""
-    return [
-        {
-            "name": spec.cli_name,
-            "description": spec.json_description,
-            "example": spec.json_example,
-        }
-        for spec in COMMAND_SPECS
-    ]
+    The tuple and its dicts are shared across calls — treat them as read-only.
+    """
+    return _HELP_JSON
 
 
-def implemented_cli_command_names() -> set[str]:
-    return {spec.cli_name for spec in COMMAND_SPECS}
+def implemented_cli_command_names() -> frozenset[str]:
+    return _IMPLEMENTED_NAMES
 
 
+def _build_alias_index() -> dict[str, str]:
+    """Map every cli_name, /cli_name and alias to its example (first spec wins)."""
+    index: dict[str, str] = {}
+    for spec in COMMAND_SPECS:
+        index.setdefault(spec.cli_name, spec.json_example)
+        for alias in spec.aliases:
+            index.setdefault(alias, spec.json_example)
+        index.setdefault("/" + spec.cli_name, spec.json_example)
+    return index
+
+
+_ALIAS_INDEX: dict[str, str] = _build_alias_index()
+
+
+@lru_cache(maxsize=256)
 def cli_example_for_alias(alias: str) -> str | None:
     """Map an intent alias or command id to the actual CLI invocation example."""
     token = (alias or "").strip()
     if not token:
         return None
 
-    for spec in COMMAND_SPECS:
-        if token == spec.cli_name or token in spec.aliases:
-            return spec.json_example
-        if token.startswith("/") and token[1:] == spec.cli_name:
-            return spec.json_example
+    example = _ALIAS_INDEX.get(token)
+    if example is not None:
+        return example
 
     if token.startswith("/"):
         token = token[1:]
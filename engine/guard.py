@@ -8,6 +8,8 @@ file create/modify/delete operation.
 
 from __future__ import annotations
 
+import configparser
+import os
 import subprocess
 from functools import lru_cache
 from pathlib import Path
@@ -28,17 +30,115 @@ class SubmoduleWriteError(Exception):
         )
 
 
-@lru_cache(maxsize=1)
+# resolved project root -> (.gitmodules mtime_ns, submodule paths,
+# (path, str(path) + os.sep) prefix pairs for fast containment checks)
+_SUBMODULE_CACHE: dict[str, tuple[int, list[Path], tuple[tuple[Path, str], ...]]] = {}
+
+
+def clear_submodule_cache() -> None:
+    """Forget detected submodules and memoized write-guard answers.
+
+    Call after adding a submodule or re-pointing symlinks under the project.
+    """
+    _SUBMODULE_CACHE.clear()
+    _is_inside.cache_clear()
+    _resolve_cached.cache_clear()
+
+
+@lru_cache(maxsize=8192)
+def _resolve_cached(path_str: str) -> str:
+    """realpath of an absolute path string, memoized for the whole process.
+
+    The memo is not invalidated by filesystem changes: callers must call
+    ``clear_submodule_cache()`` whenever the layout may have changed
+    (symlinks created or retargeted, directories moved), e.g. at the start
+    of each write batch. ``ai_run.dispatch_command`` does this per command.
+    """
+    return str(Path(path_str).resolve())
+
+
+def _gitmodules_mtime_ns(project_root: Path) -> int:
+    try:
+        return (project_root / ".gitmodules").stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _cached_submodules(project_root: Path) -> tuple[int, list[Path], tuple[tuple[Path, str], ...]]:
+    project_root = project_root.resolve()
+    key = str(project_root)
+    mtime_ns = _gitmodules_mtime_ns(project_root)
+    cached = _SUBMODULE_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached
+
+    paths = _scan_submodule_paths(project_root)
+    entry = (mtime_ns, paths, tuple((p, str(p) + os.sep) for p in paths))
+    _SUBMODULE_CACHE[key] = entry
+    return entry
+
+
 def detect_submodule_paths(project_root: Path) -> list[Path]:
     """Return resolved absolute paths of all git submodules in the project.
 
-    Uses ``git submodule status`` for reliable detection. Falls back to
-    checking common conventional paths if git is unavailable.
+    Results are cached per project root and reused until ``.gitmodules``
+    changes; empty results are cached too. The returned list is shared —
+    treat it as read-only.
     """
-    project_root = project_root.resolve()
+    return _cached_submodules(project_root)[1]
+
+
+def _parse_gitmodules(project_root: Path) -> list[Path] | None:
+    """Read submodule paths straight from ``.gitmodules``.
+
+    Returns None if the file is missing or malformed so the caller can
+    fall back to asking git.
+    """
+    gitmodules = project_root / ".gitmodules"
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        if not parser.read(gitmodules):
+            return None
+    except configparser.Error:
+        return None
+
     paths: list[Path] = []
+    for section in parser.sections():
+        if not section.startswith("submodule "):
+            continue
+        rel = parser.get(section, "path", fallback="").strip()
+        if not rel:
+            continue
+        sub_path = (project_root / rel).resolve()
+        if sub_path.is_dir():
+            paths.append(sub_path)
+    return paths
 
-    # Primary: ask git
+
+def _scan_submodule_paths(project_root: Path) -> list[Path]:
+    """Detect submodules under an already-resolved *project_root*.
+
+    Parses ``.gitmodules`` directly, asks ``git submodule status`` only if
+    that file is absent or unreadable, and finally falls back to checking
+    common conventional paths.
+    """
+    paths = _parse_gitmodules(project_root)
+    if paths is None:
+        paths = _git_submodule_status(project_root)
+
+    # Fallback: check common conventional paths
+    if not paths:
+        for candidate in (CANONICAL_SUBMODULE_PATH, "skeleton", ".ai_submodules"):
+            p = (project_root / candidate).resolve()
+            if p.is_dir() and (p / ".git").exists():
+                paths.append(p)
+
+    return paths
+
+
+def _git_submodule_status(project_root: Path) -> list[Path]:
+    """Ask git for submodule paths (empty if git is unavailable)."""
+    paths: list[Path] = []
     try:
         result = subprocess.run(
             ["git", "submodule", "status"],
@@ -48,38 +148,48 @@ def detect_submodule_paths(project_root: Path) -> list[Path]:
             timeout=5,
         )
         if result.returncode == 0:
-            for line in result.stdout.strip().splitlines():
-                # Format: " <hash> <path> (<description>)" or "-<hash> <path>"
-                parts = line.strip().lstrip("-+").split()
-                if len(parts) >= 2:
-                    sub_path = (project_root / parts[1]).resolve()
-                    if sub_path.is_dir():
-                        paths.append(sub_path)
+            paths = _parse_submodule_status(project_root, result.stdout)
     except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
+    return paths
 
-    # Fallback: check common conventional paths
-    if not paths:
-        for candidate in (CANONICAL_SUBMODULE_PATH, "skeleton", ".ai_submodules"):
-            p = (project_root / candidate).resolve()
-            if p.is_dir() and (p / ".git").exists():
-                paths.append(p)
 
+def _parse_submodule_status(project_root: Path, output: str) -> list[Path]:
+    """Extract existing submodule dirs from ``git submodule status`` output."""
+    paths: list[Path] = []
+    for line in output.strip().splitlines():
+        # Format: " <hash> <path> (<description>)", "-<hash> <path>" (not
+        # initialized) or "+<hash> <path> (<description>)" (checkout differs)
+        parts = line.lstrip(" -+").split(None, 2)
+        if len(parts) >= 2:
+            sub_path = (project_root / parts[1]).resolve()
+            if sub_path.is_dir():
+                paths.append(sub_path)
     return paths
 
 
 def is_inside_submodule(target: Path, project_root: Path) -> Path | None:
     """Check if *target* falls inside any submodule.
 
-    Returns the submodule Path if inside one, None otherwise.
+    Returns the submodule Path if inside one, None otherwise. Answers are
+    memoized per (target, project_root, .gitmodules mtime); call
+    ``clear_submodule_cache()`` if symlinks under the project change.
     """
-    target = target.resolve()
-    for sub in detect_submodule_paths(project_root):
-        try:
-            target.relative_to(sub)
+    root_str = os.path.abspath(project_root)
+    return _is_inside(
+        os.path.abspath(target), root_str, _gitmodules_mtime_ns(Path(root_str)),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _is_inside(target_str: str, root_str: str, gitmodules_mtime_ns: int) -> Path | None:
+    # gitmodules_mtime_ns is only part of the key: a changed .gitmodules
+    # misses here and _cached_submodules rescans.
+    del gitmodules_mtime_ns
+    target_prefix = _resolve_cached(target_str) + os.sep
+    for sub, sub_prefix in _cached_submodules(Path(root_str))[2]:
+        if target_prefix.startswith(sub_prefix):
             return sub
-        except ValueError:
-            continue
     return None
 
 
@@ -94,12 +204,19 @@ def check_write_allowed(target: Path, project_root: Path) -> None:
         raise SubmoduleWriteError(target, sub)
 
 
+# Skeleton path prefix → project subdirectory, checked in order (most specific first)
+_REDIRECT_PREFIXES: tuple[tuple[str, str], ...] = (
+    ("templates/.ai/", ".ai"),  # templates/.ai/* → .ai/*
+    ("templates/", ""),         # templates/* → project root
+)
+
+
 def suggest_redirect(target: Path, project_root: Path) -> str:
     """Suggest the correct project-level path when a submodule write is blocked.
 
     Attempts to map common skeleton paths to their project equivalents.
     """
-    target = target.resolve()
+    target = Path(_resolve_cached(os.path.abspath(target)))
     sub = is_inside_submodule(target, project_root)
     if sub is None:
         return str(target)
@@ -111,13 +228,10 @@ def suggest_redirect(target: Path, project_root: Path) -> str:
 
     rel_str = str(rel)
 
-    # Map templates/.ai/* → .ai/*
-    if rel_str.startswith("templates/.ai/"):
-        return str(project_root / ".ai" / rel_str[len("templates/.ai/"):])
-
-    # Map templates/* → project root
-    if rel_str.startswith("templates/"):
-        return str(project_root / rel_str[len("templates/"):])
+    for prefix, subdir in _REDIRECT_PREFIXES:
+        if rel_str.startswith(prefix):
+            base = project_root / subdir if subdir else project_root
+            return str(base / rel_str[len(prefix):])
 
     # Generic: put in .ai/ or project root
     return str(project_root / rel)
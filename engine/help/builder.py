@@ -7,10 +7,16 @@ Falls back to inspecting the filesystem directly.
 
 from __future__ import annotations
 
+import os
+import re
+from collections.abc import Sequence
+from dataclasses import replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 from ..cli_commands import cli_example_for_alias, help_json_commands
+from ..memory_core.yaml_compat import import_yaml, safe_load
 from ..submodule_paths import CANONICAL_SUBMODULE_PATH, SUBMODULE_POLICY_SUMMARY
 from .model import (
     HelpCategory,
@@ -21,10 +27,63 @@ from .model import (
     HelpIntent,
 )
 
-try:
-    import yaml
-except ImportError:
-    yaml = None  # type: ignore[assignment]
+
+def _load_yaml_cached(path: str | Path):
+    """Parse a YAML file, reusing the previous parse while mtime and size match.
+
+    The returned object is shared between calls — treat it as read-only.
+    """
+    path_str = os.fspath(path)
+    st = os.stat(path_str)
+    return _parse_yaml_file(path_str, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_file(path_str: str, mtime_ns: int, size: int):
+    del mtime_ns, size  # Part of the cache key only.
+    with open(path_str) as f:
+        return safe_load(f.read()) or {}
+
+
+_RESUME_STEPS: tuple[str, ...] = (
+    "Clone the project repo and initialize submodules.",
+    'Run "ai init --non-interactive" to rebuild local runtime from committed state.',
+    "Drop a memory pack into .ai_runtime/import_inbox/ for richer continuity (optional).",
+    'Run "ai run" — the system auto-imports the pack on startup.',
+    "The orchestrator knows current phase, tasks, and decisions from .ai/ state.",
+)
+
+_TROUBLESHOOTING: tuple[str, ...] = (
+    'Status shows no tasks: run "ai rehydrate-db" then "ai status".',
+    'Database out of sync: run "ai rehydrate-db" to rebuild from canonical YAML.',
+    f'"ai" command not found: run via full path (python {CANONICAL_SUBMODULE_PATH}/engine/ai).',
+    'YAML validation errors: run "ai validate" and fix reported issues.',
+    ".ai_runtime/ accidentally committed: git rm -r --cached .ai_runtime/ and update .gitignore.",
+    SUBMODULE_POLICY_SUMMARY,
+    "If I'm unsure about a capability, I consult the system layer (skeleton submodule) rather than guessing.",
+)
+
+# Passed to every HelpGuide as-is — HelpFileLocation is frozen so sharing is safe.
+_FILE_LOCATIONS: tuple[HelpFileLocation, ...] = (
+    HelpFileLocation(".ai/state/", "Canonical project state (team, board, approvals) — committed to git"),
+    HelpFileLocation(".ai/state/providers.yaml", "Provider registry (CLI tools, models, aliases)"),
+    HelpFileLocation(".ai/state/intents.yaml", "Intent registry (natural language routing)"),
+    HelpFileLocation(".ai/state/project.yaml", "Project scope definition (guardrails)"),
+    HelpFileLocation(".ai/state/recovery.yaml", "Worker recovery configuration"),
+    HelpFileLocation(".ai/state/persistence.yaml", "Auto-flush and sync configuration"),
+    HelpFileLocation(".ai/STATUS.md", "Auto-generated project status snapshot"),
+    HelpFileLocation(".ai/DECISIONS.md", "Append-only decision log"),
+    HelpFileLocation(".ai/METADATA.yaml", "Project ID and skeleton version"),
+    HelpFileLocation(".ai_runtime/", "Local cache — never committed, fully rebuildable"),
+    HelpFileLocation(".ai_runtime/session/memory.db", "Session memory database"),
+    HelpFileLocation(".ai_runtime/import_inbox/", "Drop memory packs here for auto-import"),
+    HelpFileLocation(".ai_runtime/memory_packs/", "Auto-exported memory packs on exit"),
+    HelpFileLocation(".ai_runtime/workers/checkpoints/", "Worker checkpoint data (auto-recovery)"),
+    HelpFileLocation(".ai/workers/", "Canonical worker state — roster, checkpoints, summaries (committed)"),
+    HelpFileLocation(".ai/workers/roster.yaml", "Worker roster (portable across machines)"),
+    HelpFileLocation(".ai/workers/checkpoints/", "Portable worker checkpoints (Markdown, human-readable)"),
+    HelpFileLocation(".ai/workers/summaries/", "Per-worker state summaries"),
+)
 
 
 def generate_help(project_root: Path, adapter: dict | None = None) -> HelpGuide:
@@ -40,8 +99,10 @@ def generate_help(project_root: Path, adapter: dict | None = None) -> HelpGuide:
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     adapter = adapter or {}
 
-    ai_dir = project_root / ".ai"
-    runtime_dir = project_root / ".ai_runtime"
+    # Internal helpers work on plain path strings; Path stays at the API edge.
+    root = os.fspath(project_root)
+    ai_dir = os.path.join(root, ".ai")
+    runtime_dir = os.path.join(root, ".ai_runtime")
 
     # --- Detect current state ---
     state = _detect_state(ai_dir, runtime_dir)
@@ -73,6 +134,7 @@ def generate_help(project_root: Path, adapter: dict | None = None) -> HelpGuide:
     # --- Commands (advanced / power user) ---
     commands = _build_commands(ai_dir)
     if adapter.get("extra_commands"):
+        commands = list(commands)
         for cmd in adapter["extra_commands"]:
             commands.append(HelpCommand(
                 name=cmd.get("name", ""),
@@ -80,48 +142,6 @@ def generate_help(project_root: Path, adapter: dict | None = None) -> HelpGuide:
                 example=cmd.get("example", ""),
             ))
 
-    # --- Resume steps ---
-    resume = [
-        "Clone the project repo and initialize submodules.",
-        'Run "ai init --non-interactive" to rebuild local runtime from committed state.',
-        "Drop a memory pack into .ai_runtime/import_inbox/ for richer continuity (optional).",
-        'Run "ai run" — the system auto-imports the pack on startup.',
-        "The orchestrator knows current phase, tasks, and decisions from .ai/ state.",
-    ]
-
-    # --- Troubleshooting ---
-    troubleshooting = [
-        'Status shows no tasks: run "ai rehydrate-db" then "ai status".',
-        'Database out of sync: run "ai rehydrate-db" to rebuild from canonical YAML.',
-        f'"ai" command not found: run via full path (python {CANONICAL_SUBMODULE_PATH}/engine/ai).',
-        'YAML validation errors: run "ai validate" and fix reported issues.',
-        ".ai_runtime/ accidentally committed: git rm -r --cached .ai_runtime/ and update .gitignore.",
-        SUBMODULE_POLICY_SUMMARY,
-        "If I'm unsure about a capability, I consult the system layer (skeleton submodule) rather than guessing.",
-    ]
-
-    # --- File locations ---
-    file_locations = [
-        HelpFileLocation(".ai/state/", "Canonical project state (team, board, approvals) — committed to git"),
-        HelpFileLocation(".ai/state/providers.yaml", "Provider registry (CLI tools, models, aliases)"),
-        HelpFileLocation(".ai/state/intents.yaml", "Intent registry (natural language routing)"),
-        HelpFileLocation(".ai/state/project.yaml", "Project scope definition (guardrails)"),
-        HelpFileLocation(".ai/state/recovery.yaml", "Worker recovery configuration"),
-        HelpFileLocation(".ai/state/persistence.yaml", "Auto-flush and sync configuration"),
-        HelpFileLocation(".ai/STATUS.md", "Auto-generated project status snapshot"),
-        HelpFileLocation(".ai/DECISIONS.md", "Append-only decision log"),
-        HelpFileLocation(".ai/METADATA.yaml", "Project ID and skeleton version"),
-        HelpFileLocation(".ai_runtime/", "Local cache — never committed, fully rebuildable"),
-        HelpFileLocation(".ai_runtime/session/memory.db", "Session memory database"),
-        HelpFileLocation(".ai_runtime/import_inbox/", "Drop memory packs here for auto-import"),
-        HelpFileLocation(".ai_runtime/memory_packs/", "Auto-exported memory packs on exit"),
-        HelpFileLocation(".ai_runtime/workers/checkpoints/", "Worker checkpoint data (auto-recovery)"),
-        HelpFileLocation(".ai/workers/", "Canonical worker state — roster, checkpoints, summaries (committed)"),
-        HelpFileLocation(".ai/workers/roster.yaml", "Worker roster (portable across machines)"),
-        HelpFileLocation(".ai/workers/checkpoints/", "Portable worker checkpoints (Markdown, human-readable)"),
-        HelpFileLocation(".ai/workers/summaries/", "Per-worker state summaries"),
-    ]
-
     return HelpGuide(
         generated_at=now,
         project_name=project_name,
@@ -129,123 +149,123 @@ def generate_help(project_root: Path, adapter: dict | None = None) -> HelpGuide:
         quick_start_steps=quick_start,
         prompt_categories=categories,
         commands=commands,
-        how_to_resume_on_new_machine=resume,
-        troubleshooting=troubleshooting,
-        where_to_find_files=file_locations,
+        how_to_resume_on_new_machine=_RESUME_STEPS,
+        troubleshooting=_TROUBLESHOOTING,
+        where_to_find_files=_FILE_LOCATIONS,
     )
 
 
-def _load_capabilities(ai_dir: Path) -> dict:
+def _load_capabilities(ai_dir: str | Path) -> dict:
     """Load capabilities.yaml from canonical state."""
-    caps_path = ai_dir / "state" / "capabilities.yaml"
-    if caps_path.exists() and yaml is not None:
+    if import_yaml() is not None:
         try:
-            return yaml.safe_load(caps_path.read_text()) or {}
+            return _load_yaml_cached(os.path.join(ai_dir, "state", "capabilities.yaml"))
         except Exception:
-            pass
+            pass  # Missing (single failed stat) or unparsable
     return {}
 
 
-def _build_prompt_categories(capabilities: dict | None = None, ai_dir: Path | None = None) -> list[HelpCategory]:
+# Fallback prompt categories used when intents.yaml is unavailable.
+# Built once; _build_prompt_categories hands out per-call copies.
+_DEFAULT_CATEGORIES: tuple[HelpCategory, ...] = (
+    HelpCategory(
+        name="Getting Started",
+        icon="\U0001f680",  # rocket
+        intents=[
+            HelpIntent("Start or initialize the project", "ai init"),
+            HelpIntent("Resume where we left off", "ai run"),
+        ],
+    ),
+    HelpCategory(
+        name="Project Visibility",
+        icon="\U0001f4ca",  # chart
+        intents=[
+            HelpIntent("Show me the current status", "ai status"),
+            HelpIntent("What's been completed and what's next?", "ai status"),
+            HelpIntent("Are there any blockers?", "ai status"),
+        ],
+    ),
+    HelpCategory(
+        name="Parallel Work (Worker Bees)",
+        icon="\U0001f41d",  # bee
+        intents=[
+            HelpIntent(
+                "Set up a team: 3 Codex devs + 1 Claude designer + 1 Gemini analyst",
+                "ai configure-team",
+                description="Parses your spec, writes team.yaml with provider/model per role",
+            ),
+            HelpIntent("Spawn worker bees", "ai spawn-workers"),
+            HelpIntent("Show me what each worker is doing", "ai workers-status"),
+            HelpIntent("Checkpoint all workers", "ai checkpoint-workers",
+                       description="Save worker progress to portable state"),
+            HelpIntent("Show me each worker's last checkpoint", "ai show-checkpoints"),
+            HelpIntent("Stop all workers", "ai stop-workers"),
+        ],
+    ),
+    HelpCategory(
+        name="Worker Recovery",
+        icon="\U0001f6e0",  # wrench
+        intents=[
+            HelpIntent("Resume stalled workers", "ai workers-resume"),
+            HelpIntent("Restart the stuck worker", "ai workers-restart"),
+        ],
+    ),
+    HelpCategory(
+        name="State Persistence",
+        icon="\U0001f4be",  # floppy
+        intents=[
+            HelpIntent("Save everything now", "ai force-sync",
+                       description="Flush state + checkpoint workers"),
+            HelpIntent("Update project state", "ai force-sync"),
+        ],
+    ),
+    HelpCategory(
+        name="Memory & Continuity",
+        icon="\U0001f9e0",  # brain
+        intents=[
+            HelpIntent("Save current progress", "ai export-memory"),
+            HelpIntent("Export project memory", "ai memory export"),
+            HelpIntent("Restore previous session", "ai import-memory"),
+        ],
+    ),
+    HelpCategory(
+        name="System Actions",
+        icon="\u2699\ufe0f",  # gear
+        intents=[
+            HelpIntent("Validate the project", "ai validate"),
+            HelpIntent("Sync project state", "ai git-sync"),
+            HelpIntent("Check if everything is working", "ai validate"),
+        ],
+    ),
+    HelpCategory(
+        name="Scope Guardrails",
+        icon="\U0001f6e1",  # shield
+        intents=[
+            HelpIntent("What's in scope for this project?", "ai scope"),
+            HelpIntent("Add this to project scope", "ai scope"),
+        ],
+    ),
+)
+
+
+def _build_prompt_categories(capabilities: dict | None = None, ai_dir: str | Path | None = None) -> list[HelpCategory]:
     """Build human-first intent categories with deterministic command mappings.
 
     If intents.yaml exists, builds categories from it (grouped by category field).
     Otherwise falls back to hardcoded categories.
     """
     # Try to build from intents.yaml
-    if ai_dir:
-        intents_path = ai_dir / "state" / "intents.yaml"
-        if intents_path.exists() and yaml is not None:
-            try:
-                result = _build_categories_from_intents(intents_path, capabilities)
-                if result:
-                    return result
-            except Exception:
-                pass  # Fall through to hardcoded
-
-    capabilities = capabilities or {}
-
-    categories = [
-        HelpCategory(
-            name="Getting Started",
-            icon="\U0001f680",  # rocket
-            intents=[
-                HelpIntent("Start or initialize the project", "ai init"),
-                HelpIntent("Resume where we left off", "ai run"),
-            ],
-        ),
-        HelpCategory(
-            name="Project Visibility",
-            icon="\U0001f4ca",  # chart
-            intents=[
-                HelpIntent("Show me the current status", "ai status"),
-                HelpIntent("What's been completed and what's next?", "ai status"),
-                HelpIntent("Are there any blockers?", "ai status"),
-            ],
-        ),
-        HelpCategory(
-            name="Parallel Work (Worker Bees)",
-            icon="\U0001f41d",  # bee
-            intents=[
-                HelpIntent(
-                    "Set up a team: 3 Codex devs + 1 Claude designer + 1 Gemini analyst",
-                    "ai configure-team",
-                    description="Parses your spec, writes team.yaml with provider/model per role",
-                ),
-                HelpIntent("Spawn worker bees", "ai spawn-workers"),
-                HelpIntent("Show me what each worker is doing", "ai workers-status"),
-                HelpIntent("Checkpoint all workers", "ai checkpoint-workers",
-                           description="Save worker progress to portable state"),
-                HelpIntent("Show me each worker's last checkpoint", "ai show-checkpoints"),
-                HelpIntent("Stop all workers", "ai stop-workers"),
-            ],
-        ),
-        HelpCategory(
-            name="Worker Recovery",
-            icon="\U0001f6e0",  # wrench
-            intents=[
-                HelpIntent("Resume stalled workers", "ai workers-resume"),
-                HelpIntent("Restart the stuck worker", "ai workers-restart"),
-            ],
-        ),
-        HelpCategory(
-            name="State Persistence",
-            icon="\U0001f4be",  # floppy
-            intents=[
-                HelpIntent("Save everything now", "ai force-sync",
-                           description="Flush state + checkpoint workers"),
-                HelpIntent("Update project state", "ai force-sync"),
-            ],
-        ),
-        HelpCategory(
-            name="Memory & Continuity",
-            icon="\U0001f9e0",  # brain
-            intents=[
-                HelpIntent("Save current progress", "ai export-memory"),
-                HelpIntent("Export project memory", "ai memory export"),
-                HelpIntent("Restore previous session", "ai import-memory"),
-            ],
-        ),
-        HelpCategory(
-            name="System Actions",
-            icon="\u2699\ufe0f",  # gear
-            intents=[
-                HelpIntent("Validate the project", "ai validate"),
-                HelpIntent("Sync project state", "ai git-sync"),
-                HelpIntent("Check if everything is working", "ai validate"),
-            ],
-        ),
-        HelpCategory(
-            name="Scope Guardrails",
-            icon="\U0001f6e1",  # shield
-            intents=[
-                HelpIntent("What's in scope for this project?", "ai scope"),
-                HelpIntent("Add this to project scope", "ai scope"),
-            ],
-        ),
-    ]
+    if ai_dir and import_yaml() is not None:
+        try:
+            result = _build_categories_from_intents(
+                os.path.join(ai_dir, "state", "intents.yaml"), capabilities
+            )
+            if result:
+                return result
+        except Exception:
+            pass  # Missing or unparsable — fall through to hardcoded
 
-    return categories
+    return [replace(cat, intents=list(cat.intents)) for cat in _DEFAULT_CATEGORIES]
 
 
 # Category metadata for intents.yaml grouping
@@ -267,9 +287,27 @@ _CATEGORY_ORDER = [
 ]
 
 
-def _build_categories_from_intents(intents_path: Path, capabilities: dict | None) -> list[HelpCategory]:
-    """Build HelpCategories from intents.yaml, grouping by category field."""
-    data = yaml.safe_load(intents_path.read_text()) or {}
+# intents.yaml path -> ((st_mtime_ns, st_size), categories built from it)
+_CATEGORIES_CACHE: dict[str, tuple[tuple[int, int], tuple[HelpCategory, ...]]] = {}
+
+
+def _build_categories_from_intents(intents_path: str, capabilities: dict | None) -> list[HelpCategory]:
+    """Build HelpCategories from intents.yaml, grouping by category field.
+
+    The built categories are cached per file and reused while its mtime and
+    size are unchanged, so a warm rebuild costs a single stat.
+    """
+    key = os.fspath(intents_path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    prev = _CATEGORIES_CACHE.get(key)
+    if prev is None or prev[0] != stamp:
+        prev = (stamp, tuple(_categories_from_intents_data(_load_yaml_cached(key))))
+        _CATEGORIES_CACHE[key] = prev
+    return [replace(cat, intents=list(cat.intents)) for cat in prev[1]]
+
+
+def _categories_from_intents_data(data: dict) -> list[HelpCategory]:
     intents = data.get("intents", [])
     if not intents:
         return []
@@ -304,17 +342,31 @@ def _build_categories_from_intents(intents_path: Path, capabilities: dict | None
     return categories
 
 
-def _detect_state(ai_dir: Path, runtime_dir: Path) -> HelpCurrentState:
+def _detect_state(ai_dir: str, runtime_dir: str) -> HelpCurrentState:
     """Inspect the filesystem to detect current project state."""
     state = HelpCurrentState()
 
-    # Initialized?
-    state.initialized = ai_dir.is_dir() and (ai_dir / "state" / "team.yaml").exists()
+    # Initialized? (one stat of team.yaml doubles as the existence check)
+    state_dir = os.path.join(ai_dir, "state")
+    team_path = os.path.join(state_dir, "team.yaml")
+    team = None
+    if import_yaml() is None:
+        state.initialized = os.path.exists(team_path)
+    else:
+        try:
+            team = _load_yaml_cached(team_path)
+            state.initialized = True
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        except OSError:
+            # e.g. unreadable: answer like a plain existence probe would
+            state.initialized = os.path.exists(team_path)
+        except Exception:
+            state.initialized = True  # Present but unparsable
 
     # Assignments configured?
-    if state.initialized and yaml is not None:
+    if team is not None:
         try:
-            team = yaml.safe_load((ai_dir / "state" / "team.yaml").read_text()) or {}
             workers = []
             for role in team.get("roles", []):
                 workers.extend(role.get("workers", []))
@@ -324,77 +376,148 @@ def _detect_state(ai_dir: Path, runtime_dir: Path) -> HelpCurrentState:
             pass
 
     # Task count
-    if state.initialized and yaml is not None:
+    if state.initialized and import_yaml() is not None:
         try:
-            board = yaml.safe_load((ai_dir / "state" / "board.yaml").read_text()) or {}
+            board = _load_yaml_cached(os.path.join(state_dir, "board.yaml"))
             state.task_count = len(board.get("tasks", []))
         except Exception:
             pass
 
     # Runtime present?
-    state.memory_runtime_present = (runtime_dir / "session" / "memory.db").exists()
+    state.memory_runtime_present = os.path.exists(os.path.join(runtime_dir, "session", "memory.db"))
 
     # Memory pack available?
-    packs_dir = runtime_dir / "memory_packs"
-    inbox_dir = runtime_dir / "import_inbox"
     state.memory_pack_available = (
-        (packs_dir.is_dir() and any(packs_dir.iterdir()))
-        or (inbox_dir.is_dir() and any(
-            p for p in inbox_dir.iterdir()
-            if p.name != "processed" and not p.name.startswith(".")
-        ))
+        _has_qualifying_entry(os.path.join(runtime_dir, "memory_packs"))
+        or _has_qualifying_entry(os.path.join(runtime_dir, "import_inbox"), _is_inbox_pack_name)
     )
 
     return state
 
 
-def _detect_project_name(ai_dir: Path) -> str:
+def _is_inbox_pack_name(name: str) -> bool:
+    return name != "processed" and not name.startswith(".")
+
+
+def _has_qualifying_entry(directory: str, predicate=None) -> bool:
+    """True if *directory* has an entry whose name satisfies *predicate*.
+
+    Stops at the first hit and never builds Path objects for entries.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return any(predicate is None or predicate(e.name) for e in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+# Top-level project_name / project_id lines in METADATA.yaml.
+_PROJECT_KEY_RE = re.compile(r"^(project_name|project_id)[ \t]*:(.*)$", re.M)
+# Values whose YAML meaning is unambiguously the literal string: simple
+# quoted scalars, letter-led plain words, or a bare UUID.
+_PROJECT_VALUE_RE = re.compile(
+    r"""[ \t]*(?:"([^"\\\n]*)"|'([^'\n]*)'|"""
+    r"""([A-Za-z][\w.-]*(?:[ \t]+[\w.-]+)*"""
+    r"""|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}))"""
+    r"""(?:[ \t]+#.*|[ \t]*)"""
+)
+_YAML_WORDS = frozenset(("yes", "no", "true", "false", "on", "off", "null"))
+
+
+def _sniff_project_names(text: str) -> dict[str, str] | None:
+    """Pull project_name / project_id out of METADATA.yaml text without parsing.
+
+    Returns None when nothing matches, when a key repeats, when a value is
+    anything but a plain string scalar, or when a key is mentioned in a form
+    the line regex misses (quoted key, flow mapping), so the caller can fall
+    back to a full YAML parse.
+    """
+    found: dict[str, str] = {}
+    for m in _PROJECT_KEY_RE.finditer(text):
+        value = _PROJECT_VALUE_RE.fullmatch(m.group(2))
+        if m.group(1) in found or value is None:
+            return None
+        quoted_double, quoted_single, plain = value.groups()
+        if plain is not None and plain.lower() in _YAML_WORDS:
+            return None
+        found[m.group(1)] = next(v for v in (quoted_double, quoted_single, plain) if v is not None)
+    if not found or any(key not in found and key in text for key in ("project_name", "project_id")):
+        return None
+    return found
+
+
+@lru_cache(maxsize=8)
+def _project_names(path_str: str, mtime_ns: int, size: int) -> dict:
+    with open(path_str) as f:
+        names = _sniff_project_names(f.read())
+    if names is not None:
+        return names
+    if import_yaml() is None:
+        return {}
+    return _parse_yaml_file(path_str, mtime_ns, size)
+
+
+def _detect_project_name(ai_dir: str) -> str:
     """Try to read project name from METADATA.yaml."""
-    meta_path = ai_dir / "METADATA.yaml"
-    if meta_path.exists() and yaml is not None:
-        try:
-            meta = yaml.safe_load(meta_path.read_text()) or {}
-            name = meta.get("project_name") or meta.get("project_id", "")
-            if name and name != "PLACEHOLDER":
-                return name
-        except Exception:
-            pass
+    try:
+        path = os.path.join(ai_dir, "METADATA.yaml")
+        st = os.stat(path)
+        meta = _project_names(path, st.st_mtime_ns, st.st_size)
+        name = meta.get("project_name") or meta.get("project_id", "")
+        if name and name != "PLACEHOLDER":
+            return name
+    except Exception:
+        pass
     return "This Project"
 
 
-def _build_quick_start(state: HelpCurrentState, ai_dir: Path) -> list[str]:
-    """Build context-aware quick start steps."""
+_QS_UNINITIALIZED: tuple[str, ...] = (
+    'Say "Start or initialize the project" (or run ai init).',
+    "The system will walk you through team setup and approval rules.",
+    'After setup, say "Show me the current status" to see the project dashboard.',
+)
+_QS_CONFIGURE_TEAM = "Configure your team: tell the orchestrator what roles and workers you need."
+_QS_ADD_TASKS = "Add tasks: describe your project goals and the orchestrator will create a task board."
+_QS_WHATS_NEXT = 'Say "What\'s next?" to see prioritized upcoming work.'
+_QS_START_RUN = 'Say "Resume where we left off" to start the orchestrator with automatic persistence.'
+_QS_MEMORY_ACTIVE = "Session memory is active. All turns are persisted automatically."
+
+
+def _build_quick_start(state: HelpCurrentState, ai_dir: str) -> Sequence[str]:
+    """Build context-aware quick start steps.
+
+    The uninitialized steps are a shared tuple — treat the result as read-only.
+    """
     if not state.initialized:
-        return [
-            'Say "Start or initialize the project" (or run ai init).',
-            "The system will walk you through team setup and approval rules.",
-            'After setup, say "Show me the current status" to see the project dashboard.',
-        ]
+        return _QS_UNINITIALIZED
 
     steps = []
 
     if not state.assignments_configured:
-        steps.append("Configure your team: tell the orchestrator what roles and workers you need.")
+        steps.append(_QS_CONFIGURE_TEAM)
 
     if state.task_count == 0:
-        steps.append("Add tasks: describe your project goals and the orchestrator will create a task board.")
+        steps.append(_QS_ADD_TASKS)
     else:
         steps.append(f'Say "Show me the current status" to see {state.task_count} tracked task(s) and progress.')
 
-    steps.append('Say "What\'s next?" to see prioritized upcoming work.')
-
-    if not state.memory_runtime_present:
-        steps.append('Say "Resume where we left off" to start the orchestrator with automatic persistence.')
-    else:
-        steps.append("Session memory is active. All turns are persisted automatically.")
+    steps.append(_QS_WHATS_NEXT)
+    steps.append(_QS_MEMORY_ACTIVE if state.memory_runtime_present else _QS_START_RUN)
 
     return steps
 
 
-def _build_commands(ai_dir: Path) -> list[HelpCommand]:
-    """Build command list from the shared CLI command registry."""
+# COMMAND_SPECS is frozen, so the HelpCommand entries are built once.
+_HELP_COMMANDS: tuple[HelpCommand, ...] = tuple(
+    HelpCommand(item["name"], item["description"], item["example"])
+    for item in help_json_commands()
+)
+
+
+def _build_commands(ai_dir: str) -> tuple[HelpCommand, ...]:
+    """Return the shared command entries from the CLI command registry.
+
+    Callers that extend the list must copy it first.
+    """
     del ai_dir  # Commands are sourced from the CLI registry, not YAML.
-    return [
-        HelpCommand(item["name"], item["description"], item["example"])
-        for item in help_json_commands()
-    ]
+    return _HELP_COMMANDS
@@ -8,9 +8,19 @@ from __future__ import annotations
 
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .model import HelpGuide
 
 
 def render_help_json(guide: HelpGuide, indent: int = 2) -> str:
     """Serialize a HelpGuide to JSON string."""
-    return json.dumps(guide.to_dict(), indent=indent, ensure_ascii=False)
+    data = guide.to_dict()
+    # orjson's OPT_INDENT_2 output matches json.dumps(indent=2, ensure_ascii=False)
+    # for the str/int/bool/list/dict payload the help model produces.
+    if orjson is not None and indent == 2:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=indent, ensure_ascii=False)
@@ -7,10 +7,13 @@ Terminal and JSON renderers both consume this model.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
+from ..memory_core.models import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class HelpIntent:
     """A human-friendly prompt mapped to a deterministic command."""
     prompt: str
@@ -18,10 +21,10 @@ class HelpIntent:
     description: str = ""
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {"prompt": self.prompt, "command": self.command, "description": self.description}
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HelpCategory:
     """A group of related intents under a named category."""
     name: str
@@ -36,26 +39,26 @@ class HelpCategory:
         }
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class HelpCommand:
     name: str
     description: str
     example: str = ""
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {"name": self.name, "description": self.description, "example": self.example}
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class HelpFileLocation:
     path: str
     description: str
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {"path": self.path, "description": self.description}
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HelpCurrentState:
     initialized: bool = False
     assignments_configured: bool = False
@@ -65,30 +68,38 @@ class HelpCurrentState:
     worker_count: int = 0
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "initialized": self.initialized,
+            "assignments_configured": self.assignments_configured,
+            "memory_runtime_present": self.memory_runtime_present,
+            "memory_pack_available": self.memory_pack_available,
+            "task_count": self.task_count,
+            "worker_count": self.worker_count,
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HelpGuide:
     generated_at: str
     project_name: str
     current_state: HelpCurrentState = field(default_factory=HelpCurrentState)
-    quick_start_steps: list[str] = field(default_factory=list)
+    quick_start_steps: Sequence[str] = field(default_factory=list)
     prompt_categories: list[HelpCategory] = field(default_factory=list)
-    commands: list[HelpCommand] = field(default_factory=list)
-    how_to_resume_on_new_machine: list[str] = field(default_factory=list)
-    troubleshooting: list[str] = field(default_factory=list)
-    where_to_find_files: list[HelpFileLocation] = field(default_factory=list)
+    # Static sections may be shared, immutable tuples from the builder.
+    commands: Sequence[HelpCommand] = field(default_factory=list)
+    how_to_resume_on_new_machine: Sequence[str] = field(default_factory=list)
+    troubleshooting: Sequence[str] = field(default_factory=list)
+    where_to_find_files: Sequence[HelpFileLocation] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         return {
             "generated_at": self.generated_at,
             "project_name": self.project_name,
             "current_state": self.current_state.to_dict(),
-            "quick_start_steps": self.quick_start_steps,
+            "quick_start_steps": list(self.quick_start_steps),
             "prompt_categories": [c.to_dict() for c in self.prompt_categories],
             "commands": [c.to_dict() for c in self.commands],
-            "how_to_resume_on_new_machine": self.how_to_resume_on_new_machine,
-            "troubleshooting": self.troubleshooting,
+            "how_to_resume_on_new_machine": list(self.how_to_resume_on_new_machine),
+            "troubleshooting": list(self.troubleshooting),
             "where_to_find_files": [f.to_dict() for f in self.where_to_find_files],
         }
@@ -8,6 +8,7 @@ All rendering derives from the help model (which is JSON-serializable).
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from .model import HelpGuide
@@ -15,13 +16,10 @@ from .model import HelpGuide
 
 def render_help_terminal(guide: HelpGuide, project_root: Path | None = None) -> str:
     """Render a HelpGuide as terminal-friendly text."""
-    W = 72
     lines: list[str] = []
 
     # ── Header ──
-    lines.append("=" * W)
-    lines.append(_center("SCAFFOLD AI — GUIDE", W))
-    lines.append("=" * W)
+    lines.extend(_HEADER)
     lines.append(f"  Project:   {guide.project_name}")
     lines.append(f"  Generated: {guide.generated_at}")
     lines.append("")
@@ -57,8 +55,7 @@ def render_help_terminal(guide: HelpGuide, project_root: Path | None = None) ->
 
     # ── Human Prompt Guide (PRIMARY) ──
     lines.append(_section("What You Can Say"))
-    lines.append("  Just tell the orchestrator what you need:")
-    lines.append("")
+    lines.extend(("  Just tell the orchestrator what you need:", ""))
     for category in guide.prompt_categories:
         lines.append(f"  {category.icon} {category.name}")
         for intent in category.intents:
@@ -70,11 +67,10 @@ def render_help_terminal(guide: HelpGuide, project_root: Path | None = None) ->
     # ── Commands (SECONDARY — advanced) ──
     if guide.commands:
         lines.append(_section("Advanced (optional commands)"))
-        lines.append("  Use /command or ai <command> for direct execution:")
-        lines.append("")
-        max_name = max(len(c.name) for c in guide.commands)
+        lines.extend(("  Use /command or ai <command> for direct execution:", ""))
+        pad = max(len(c.name) for c in guide.commands) + 2
         for cmd in guide.commands:
-            lines.append(f"  {cmd.name:<{max_name + 2}} {cmd.description}")
+            lines.append("  " + cmd.name.ljust(pad) + " " + cmd.description)
         lines.append("")
 
     # ── Resume ──
@@ -96,15 +92,22 @@ def render_help_terminal(guide: HelpGuide, project_root: Path | None = None) ->
         lines.append(f"  - {tip}")
     lines.append("")
 
-    lines.append("=" * W)
+    lines.append(_RULE)
 
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=32)
 def _center(text: str, width: int) -> str:
     pad = (width - len(text)) // 2
     return " " * pad + text
 
 
+@lru_cache(maxsize=32)
 def _section(title: str) -> str:
     return f"  --- {title} ---"
+
+
+_WIDTH = 72
+_RULE = "=" * _WIDTH
+_HEADER = (_RULE, _center("SCAFFOLD AI — GUIDE", _WIDTH), _RULE)
@@ -2,7 +2,8 @@
 memory_core — Decoupled persistent session memory for AI orchestration.
 
 Designed for future extraction into its own repository.
-Only api.py should be imported from outside this package.
+Only api.py (and the dependency-free yaml_compat.py and models.py) should
+be imported from outside this package.
 """
 
 __version__ = "0.1.0"
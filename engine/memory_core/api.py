@@ -8,9 +8,10 @@ All access goes through the SessionMemory class.
 from __future__ import annotations
 
 import sqlite3
+import zipfile
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from . import packs as _packs
 from . import policy as _policy
@@ -19,6 +20,9 @@ from . import store_sqlite as _store
 from .models import Fact, MemoryPolicy, Message, Summary
 from .redact import redact
 
+# Distinct get_context argument sets kept per SessionMemory instance.
+_CONTEXT_CACHE_SIZE = 64
+
 
 class SessionMemory:
     """Decoupled persistent session memory.
@@ -42,6 +46,12 @@ class SessionMemory:
         self._db_path = _store.get_db_path(self._project_root, db_path)
         self._conn: sqlite3.Connection | None = None
         self._fts_enabled: bool = False
+        # get_context results keyed on its arguments. Each entry is stamped
+        # with (_write_counter, PRAGMA data_version): the counter tracks writes
+        # through this instance, data_version tracks commits by other
+        # connections, so a stale entry is never served.
+        self._write_counter = 0
+        self._context_cache: dict[tuple, tuple[tuple[int, int], list[dict[str, str]]]] = {}
 
         # Load policy
         if policy_path is None:
@@ -63,6 +73,8 @@ class SessionMemory:
         if self._conn is not None:
             self._conn.close()
             self._conn = None
+            # data_version is per-connection; stamps from the old one are void.
+            self._context_cache.clear()
 
     # ── Messages ──
 
@@ -79,20 +91,47 @@ class SessionMemory:
         Applies redaction and policy checks before persistence.
         Returns the message row id, or None if rejected by policy.
         """
-        if not _policy.check_persist(self._policy, namespace):
+        ns_policy = self._policy.get_namespace_policy(namespace)
+        if ns_policy.persist == "none":
             return None
 
-        if not _policy.check_role_allowed(self._policy, namespace, role):
+        if role not in ns_policy.allowed_roles:
             return None
 
         # Redact sensitive content
-        denylist = _policy.get_denylist(self._policy, namespace)
-        safe_content = redact(content, denylist)
+        safe_content = redact(content, self._policy.merged_denylist(namespace))
 
+        self._write_counter += 1
         return _store.insert_message(
             self.conn, session_id, namespace, role, safe_content, metadata,
         )
 
+    def add_messages(
+        self,
+        session_id: str,
+        namespace: str,
+        messages: Iterable[tuple[str, str] | tuple[str, str, dict[str, Any] | None]],
+    ) -> int:
+        """Add several (role, content[, metadata]) messages in one transaction.
+
+        Applies the same policy checks and redaction as add_message.
+        Returns the number of messages stored.
+        """
+        ns_policy = self._policy.get_namespace_policy(namespace)
+        if ns_policy.persist == "none":
+            return 0
+
+        denylist = self._policy.merged_denylist(namespace)
+        rows = [
+            (session_id, namespace, m[0], redact(m[1], denylist), m[2] if len(m) > 2 else None)
+            for m in messages
+            if m[0] in ns_policy.allowed_roles
+        ]
+        if not rows:
+            return 0
+        self._write_counter += 1
+        return _store.insert_messages(self.conn, rows)
+
     def get_recent_messages(
         self,
         session_id: str,
@@ -106,8 +145,7 @@ class SessionMemory:
         if limit is None:
             limit = _policy.get_max_recent(self._policy, namespace)
 
-        messages = _store.get_recent_messages(self.conn, session_id, namespace, limit)
-        return [m.to_dict() for m in messages]
+        return _store.get_recent_messages(self.conn, session_id, namespace, limit, as_dict=True)
 
     def search(
         self,
@@ -117,11 +155,10 @@ class SessionMemory:
         limit: int = 20,
     ) -> list[dict[str, str]]:
         """Search messages by content. Returns model-ready dicts."""
-        messages = _search.search_messages(
+        return _search.search_messages(
             self.conn, session_id, namespace, query, limit,
-            use_fts=self._fts_enabled,
+            use_fts=self._fts_enabled, as_dict=True,
         )
-        return [m.to_dict() for m in messages]
 
     # ── Context assembly ──
 
@@ -142,40 +179,63 @@ class SessionMemory:
         This is the primary token-reduction mechanism:
         instead of replaying full history, the model receives
         a compact context window.
+
+        Results are cached until the next write to the database; each call
+        returns fresh dicts so callers may modify them.
         """
+        key = (session_id, namespace, query, max_recent, max_facts, max_summary)
+        stamp = (self._write_counter, self.conn.execute("PRAGMA data_version").fetchone()[0])
+        cached = self._context_cache.get(key)
+        if cached is None or cached[0] != stamp:
+            if len(self._context_cache) >= _CONTEXT_CACHE_SIZE:
+                self._context_cache.clear()
+            cached = (stamp, self._build_context(*key))
+            self._context_cache[key] = cached
+        return [dict(m) for m in cached[1]]
+
+    def _build_context(
+        self,
+        session_id: str,
+        namespace: str,
+        query: str | None,
+        max_recent: int,
+        max_facts: int,
+        max_summary: int,
+    ) -> list[dict[str, str]]:
         context: list[dict[str, str]] = []
 
-        # 1. Rolling summary (if any)
-        if max_summary > 0:
-            summary = _store.get_summary(self.conn, session_id, namespace)
-            if summary:
-                context.append({
-                    "role": "system",
-                    "content": f"[Session Summary]\n{summary.summary_text}",
-                })
-
-        # 2. Relevant facts
-        if max_facts > 0:
-            if query:
-                facts = _search.search_facts(
+        # Summary, recent messages and (without a query) top facts come back
+        # from one statement; a query switches facts to a text search.
+        summary, fact_texts, recent = _store.fetch_context(
+            self.conn, session_id, namespace,
+            max_recent=max_recent,
+            max_facts=0 if query else max_facts,
+            want_summary=max_summary > 0,
+        )
+        if query and max_facts > 0:
+            fact_texts = [
+                f.fact_text for f in _search.search_facts(
                     self.conn, session_id, namespace, query, max_facts,
                     use_fts=self._fts_enabled,
                 )
-            else:
-                facts_raw = _store.get_facts(self.conn, session_id, namespace, max_facts)
-                facts = facts_raw
+            ]
+
+        # 1. Rolling summary (if any)
+        if summary is not None:
+            context.append({
+                "role": "system",
+                "content": f"[Session Summary]\n{summary}",
+            })
 
-            if facts:
-                fact_lines = [f"- {f.fact_text}" for f in facts]
-                context.append({
-                    "role": "system",
-                    "content": "[Key Facts]\n" + "\n".join(fact_lines),
-                })
+        # 2. Relevant facts
+        if fact_texts:
+            context.append({
+                "role": "system",
+                "content": "[Key Facts]\n" + "\n".join(f"- {t}" for t in fact_texts),
+            })
 
         # 3. Recent messages
-        if max_recent > 0:
-            recent = _store.get_recent_messages(self.conn, session_id, namespace, max_recent)
-            context.extend(m.to_dict() for m in recent)
+        context.extend(recent)
 
         return context
 
@@ -189,8 +249,8 @@ class SessionMemory:
         scope: str = "rolling",
     ) -> int:
         """Insert or update a summary for a session/namespace."""
-        denylist = _policy.get_denylist(self._policy, namespace)
-        safe_text = redact(summary_text, denylist)
+        safe_text = redact(summary_text, self._policy.merged_denylist(namespace))
+        self._write_counter += 1
         return _store.upsert_summary(self.conn, session_id, namespace, safe_text, scope)
 
     # ── Facts ──
@@ -204,24 +264,25 @@ class SessionMemory:
         tags: list[str] | None = None,
     ) -> int | None:
         """Add a distilled fact. Returns row id or None if rejected."""
-        if not _policy.check_persist(self._policy, namespace):
+        ns_policy = self._policy.get_namespace_policy(namespace)
+        if ns_policy.persist == "none":
             return None
 
-        denylist = _policy.get_denylist(self._policy, namespace)
-        safe_text = redact(fact_text, denylist)
+        safe_text = redact(fact_text, self._policy.merged_denylist(namespace))
 
         # Enforce max_facts by dropping lowest importance
-        max_facts = _policy.get_max_facts(self._policy, namespace)
         current_count = _store.get_fact_count(self.conn, session_id, namespace)
-        if current_count >= max_facts:
+        if current_count >= ns_policy.max_facts:
             self.dedupe_facts(session_id, namespace)
 
+        self._write_counter += 1
         return _store.insert_fact(
             self.conn, session_id, namespace, safe_text, importance, tags,
         )
 
     def dedupe_facts(self, session_id: str, namespace: str) -> int:
         """Remove superseded facts. Returns count removed."""
+        self._write_counter += 1
         return _store.delete_superseded_facts(self.conn, session_id, namespace)
 
     # ── Purge ──
@@ -245,6 +306,7 @@ class SessionMemory:
             cutoff = datetime.now(timezone.utc) - timedelta(days=older_than_days)
             older_than_iso = cutoff.isoformat()
 
+        self._write_counter += 1
         return {
             "messages": _store.purge_messages(self.conn, namespace, older_than_iso),
             "facts": _store.purge_facts(self.conn, namespace, older_than_iso),
@@ -257,12 +319,19 @@ class SessionMemory:
         self,
         out_path: str | Path,
         namespaces: list[str] | None = None,
+        *,
+        compression: int = zipfile.ZIP_DEFLATED,
+        compresslevel: int | None = None,
     ) -> str:
         """Export session memory as a portable pack."""
-        return _packs.export_pack(self.conn, out_path, namespaces)
+        return _packs.export_pack(
+            self.conn, out_path, namespaces,
+            compression=compression, compresslevel=compresslevel,
+        )
 
     def import_pack(self, pack_path: str | Path) -> dict[str, int]:
         """Import a session memory pack (append-safe)."""
+        self._write_counter += 1
         return _packs.import_pack(self.conn, pack_path)
 
     # ── Introspection ──
@@ -6,11 +6,19 @@ Pure data structures with no external dependencies.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
+# dataclass kwargs for __slots__, which drop the per-instance __dict__.
+# dataclass(slots=) needs 3.10+ while the supported floor is 3.9, so older
+# interpreters get plain dataclasses. Both layouts must behave the same:
+# nothing may rely on slots (e.g. to reject stray attributes) or set
+# attributes that are not declared fields. Shared with engine.help.model.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Message:
     """A single chat message in model-ready format."""
     id: int | None
@@ -26,7 +34,7 @@ class Message:
         return {"role": self.role, "content": self.content}
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Fact:
     """A distilled fact extracted from conversation."""
     id: int | None
@@ -39,7 +47,7 @@ class Fact:
     supersedes_id: int | None = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Summary:
     """A rolling or scoped summary of conversation history."""
     id: int | None
@@ -50,7 +58,7 @@ class Summary:
     scope: str = "rolling"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NamespacePolicy:
     """Policy configuration for a single namespace."""
     persist: str = "full"  # full | summary_only | distilled_only | none
@@ -58,24 +66,73 @@ class NamespacePolicy:
     max_recent_messages: int = 200
     distill_every_n_turns: int = 20
     max_facts: int = 500
-    allowed_roles: list[str] = field(default_factory=lambda: ["user", "assistant", "system"])
-    denylist: list[str] = field(default_factory=list)
+    allowed_roles: frozenset[str] = frozenset(("user", "assistant", "system"))
+    denylist: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MemoryPolicy:
     """Full policy configuration across all namespaces."""
     namespaces: dict[str, NamespacePolicy] = field(default_factory=dict)
     global_denylist: list[str] = field(default_factory=list)
     auto_export_on_exit: bool = True
     auto_import_inbox: bool = True
+    # namespace -> resolved policy. Policies are not mutated after load, so
+    # entries never go stale; call clear_resolved() if namespaces is edited.
+    _resolved: dict[str, NamespacePolicy] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # namespace -> global + namespace denylist, merged once per namespace.
+    _denylists: dict[str, tuple[str, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (prefix, policy) for each "prefix*" namespace, in declaration order.
+    _wildcards: list[tuple[str, NamespacePolicy]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._index_wildcards()
 
     def get_namespace_policy(self, namespace: str) -> NamespacePolicy:
         """Get policy for a namespace, falling back to defaults."""
+        try:
+            return self._resolved[namespace]
+        except KeyError:
+            policy = self._resolved[namespace] = self._resolve(namespace)
+            return policy
+
+    def merged_denylist(self, namespace: str) -> tuple[str, ...]:
+        """Global denylist followed by the namespace's own patterns.
+
+        The same tuple is returned on every call for a given namespace.
+        """
+        try:
+            return self._denylists[namespace]
+        except KeyError:
+            merged = self._denylists[namespace] = (
+                *self.global_denylist, *self.get_namespace_policy(namespace).denylist,
+            )
+            return merged
+
+    def clear_resolved(self) -> None:
+        """Drop cached namespace lookups after editing the policy."""
+        self._resolved.clear()
+        self._denylists.clear()
+        self._index_wildcards()
+
+    def _index_wildcards(self) -> None:
+        self._wildcards = [
+            (pattern[:-1], policy)
+            for pattern, policy in self.namespaces.items()
+            if pattern.endswith("*")
+        ]
+
+    def _resolve(self, namespace: str) -> NamespacePolicy:
         if namespace in self.namespaces:
             return self.namespaces[namespace]
         # Check wildcard patterns (e.g. worker_* matches worker_dev)
-        for pattern, policy in self.namespaces.items():
-            if pattern.endswith("*") and namespace.startswith(pattern[:-1]):
+        for prefix, policy in self._wildcards:
+            if namespace.startswith(prefix):
                 return policy
         return NamespacePolicy()
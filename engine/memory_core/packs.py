@@ -21,6 +21,9 @@ def export_pack(
     conn: sqlite3.Connection,
     out_path: str | Path,
     namespaces: list[str] | None = None,
+    *,
+    compression: int = zipfile.ZIP_DEFLATED,
+    compresslevel: int | None = None,
 ) -> str:
     """Export session memory as a portable pack.
 
@@ -28,6 +31,9 @@ def export_pack(
         conn: Database connection.
         out_path: Output path (directory or .zip).
         namespaces: Optional filter. None = export all.
+        compression: zipfile method for .zip output (ZIP_STORED skips
+            compression, e.g. for throwaway packs).
+        compresslevel: Optional level for the compression method.
 
     Returns:
         Path to the created pack.
@@ -101,7 +107,7 @@ def export_pack(
     (pack_dir / "checksums.json").write_text(json.dumps(checksums, indent=2))
 
     if is_zip:
-        with zipfile.ZipFile(str(out), "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(str(out), "w", compression, compresslevel=compresslevel) as zf:
             for fpath in pack_dir.rglob("*"):
                 if fpath.is_file():
                     zf.write(str(fpath), fpath.relative_to(pack_dir))
@@ -7,15 +7,32 @@ redaction denylist, and role filtering.
 
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from .models import MemoryPolicy, NamespacePolicy
+from .yaml_compat import import_yaml, safe_load
 
-try:
-    import yaml
-except ImportError:
-    yaml = None  # type: ignore[assignment]
+
+# absolute path -> (st_mtime_ns, st_size, parsed document)
+_yaml_cache: dict[str, tuple[int, int, Any]] = {}
+
+
+def _cached_yaml(path: Path) -> Any:
+    """Parse a YAML file, reusing the last parse while mtime and size match.
+
+    The returned document is shared between calls — treat it as read-only.
+    """
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    data = safe_load(path.read_text()) or {}
+    _yaml_cache[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
 
 
 def _parse_namespace_policy(data: dict[str, Any]) -> NamespacePolicy:
@@ -26,8 +43,8 @@ def _parse_namespace_policy(data: dict[str, Any]) -> NamespacePolicy:
         max_recent_messages=data.get("max_recent_messages", 200),
         distill_every_n_turns=data.get("distill_every_n_turns", 20),
         max_facts=data.get("max_facts", 500),
-        allowed_roles=data.get("allowed_roles", ["user", "assistant", "system"]),
-        denylist=data.get("denylist", []),
+        allowed_roles=frozenset(data.get("allowed_roles", ("user", "assistant", "system"))),
+        denylist=tuple(data.get("denylist", ())),
     )
 
 
@@ -47,12 +64,12 @@ def load_policy(policy_path: Path | str | None = None) -> MemoryPolicy:
     if not path.exists():
         return _default_policy()
 
-    if yaml is None:
+    if import_yaml() is None:
         return _default_policy()
 
-    data = yaml.safe_load(path.read_text()) or {}
+    data = _cached_yaml(path)
 
-    global_denylist = data.get("global_denylist", [])
+    global_denylist = list(data.get("global_denylist", []))
     namespaces: dict[str, NamespacePolicy] = {}
 
     for ns_name, ns_data in data.get("namespaces", {}).items():
@@ -67,8 +84,12 @@ def load_policy(policy_path: Path | str | None = None) -> MemoryPolicy:
     )
 
 
+@lru_cache(maxsize=1)
 def _default_policy() -> MemoryPolicy:
-    """Return hardcoded default policy."""
+    """Return hardcoded default policy.
+
+    Built once and shared by every caller; policies are read-only after load.
+    """
     return MemoryPolicy(
         namespaces={
             "orchestrator": NamespacePolicy(persist="full"),
@@ -94,10 +115,9 @@ def check_role_allowed(policy: MemoryPolicy, namespace: str, role: str) -> bool:
     return role in ns_policy.allowed_roles
 
 
-def get_denylist(policy: MemoryPolicy, namespace: str) -> list[str]:
+def get_denylist(policy: MemoryPolicy, namespace: str) -> tuple[str, ...]:
     """Get combined denylist (global + namespace-specific)."""
-    ns_policy = policy.get_namespace_policy(namespace)
-    return policy.global_denylist + ns_policy.denylist
+    return policy.merged_denylist(namespace)
 
 
 def get_retention_days(policy: MemoryPolicy, namespace: str) -> int:
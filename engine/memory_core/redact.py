@@ -8,39 +8,58 @@ before it reaches the database. Configurable via policy denylist.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 PLACEHOLDER = "[REDACTED]"
 
-# Built-in patterns (always applied)
-_BUILTIN_PATTERNS: list[re.Pattern] = [
+# Built-in patterns (always applied). Each is (prefix, value): the prefix
+# is kept and the value replaced. An empty prefix redacts the whole match.
+# Case-insensitive unless noted.
+_BUILTIN_RULES: list[tuple[str, str]] = [
     # Authorization headers
-    re.compile(r"(Authorization:\s*)(Bearer\s+)\S+", re.IGNORECASE),
-    re.compile(r"(Authorization:\s*)(Basic\s+)\S+", re.IGNORECASE),
+    (r"Authorization:\s*", r"Bearer\s+\S+"),
+    (r"Authorization:\s*", r"Basic\s+\S+"),
     # Bearer tokens standalone
-    re.compile(r"(bearer\s+)[A-Za-z0-9\-._~+/]+=*", re.IGNORECASE),
+    (r"bearer\s+", r"[A-Za-z0-9\-._~+/]+=*"),
     # API keys in common formats
-    re.compile(r"((?:api[_-]?key|apikey|api_secret|secret_key)\s*[:=]\s*)['\"]?[A-Za-z0-9\-._~+/]{16,}['\"]?", re.IGNORECASE),
-    # sk-... style keys (OpenAI, Anthropic, Stripe, etc.)
-    re.compile(r"\b(sk-[A-Za-z0-9\-]{20,})\b"),
+    (r"(?:api[_-]?key|apikey|api_secret|secret_key)\s*[:=]\s*", r"['\"]?[A-Za-z0-9\-._~+/]{16,}['\"]?"),
+    # sk-... style keys (OpenAI, Anthropic, Stripe, etc.) — case-sensitive
+    ("", r"(?-i:\bsk-[A-Za-z0-9\-]{20,}\b)"),
     # OAuth authorization codes
-    re.compile(r"(code=)[A-Za-z0-9\-._~+/]{16,}", re.IGNORECASE),
+    (r"code=", r"[A-Za-z0-9\-._~+/]{16,}"),
     # Generic long hex/base64 tokens after common key names
-    re.compile(r"((?:token|secret|password|credentials?)\s*[:=]\s*)['\"]?[A-Za-z0-9\-._~+/]{20,}['\"]?", re.IGNORECASE),
+    (r"(?:token|secret|password|credentials?)\s*[:=]\s*", r"['\"]?[A-Za-z0-9\-._~+/]{20,}['\"]?"),
 ]
 
+# All rules as one alternation so text is scanned once. Rule i keeps its
+# prefix in group p<i>; m.lastgroup names the rule that matched.
+_BUILTIN_RE = re.compile(
+    "|".join(
+        f"(?P<p{i}>{prefix}){value}" if prefix else value
+        for i, (prefix, value) in enumerate(_BUILTIN_RULES)
+    ),
+    re.IGNORECASE,
+)
 
-def _compile_denylist(denylist: list[str]) -> list[re.Pattern]:
-    """Compile user-provided regex strings into patterns."""
+
+def _redact_match(m: re.Match) -> str:
+    prefix = m.lastgroup
+    return m.group(prefix) + PLACEHOLDER if prefix else PLACEHOLDER
+
+
+@lru_cache(maxsize=64)
+def _compile_denylist(denylist: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    """Compile user-provided regex strings into patterns (memoized per tuple)."""
     compiled = []
     for pattern_str in denylist:
         try:
             compiled.append(re.compile(pattern_str, re.IGNORECASE))
         except re.error:
             continue  # Skip invalid patterns silently
-    return compiled
+    return tuple(compiled)
 
 
-def redact(text: str, denylist: list[str] | None = None) -> str:
+def redact(text: str, denylist: list[str] | tuple[str, ...] | None = None) -> str:
     """Redact sensitive patterns from text.
 
     Args:
@@ -53,19 +72,11 @@ def redact(text: str, denylist: list[str] | None = None) -> str:
     if not text:
         return text
 
-    result = text
-
-    # Apply built-in patterns
-    for pattern in _BUILTIN_PATTERNS:
-        # For patterns with capture groups, keep the prefix and redact the value
-        if pattern.groups:
-            result = pattern.sub(lambda m: m.group(0)[:len(m.group(1))] + PLACEHOLDER, result)
-        else:
-            result = pattern.sub(PLACEHOLDER, result)
+    result = _BUILTIN_RE.sub(_redact_match, text)
 
     # Apply user denylist patterns
     if denylist:
-        for pattern in _compile_denylist(denylist):
+        for pattern in _compile_denylist(tuple(denylist)):
             result = pattern.sub(PLACEHOLDER, result)
 
     return result
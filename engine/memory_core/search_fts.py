@@ -9,7 +9,7 @@ from __future__ import annotations
 import sqlite3
 
 from .models import Fact, Message
-from .store_sqlite import _row_to_fact, _row_to_message
+from .store_sqlite import _row_to_fact, _row_to_message, fetch_message_dicts
 
 
 def search_messages(
@@ -19,11 +19,15 @@ def search_messages(
     query: str,
     limit: int = 20,
     use_fts: bool = True,
-) -> list[Message]:
-    """Search messages by content. Uses FTS5 if available, falls back to LIKE."""
+    as_dict: bool = False,
+) -> list[Message] | list[dict[str, str]]:
+    """Search messages by content. Uses FTS5 if available, falls back to LIKE.
+
+    With as_dict=True, returns model-ready {role, content} dicts directly.
+    """
     if use_fts and _has_fts_table(conn, "messages_fts"):
-        return _fts_search_messages(conn, session_id, namespace, query, limit)
-    return _like_search_messages(conn, session_id, namespace, query, limit)
+        return _fts_search_messages(conn, session_id, namespace, query, limit, as_dict)
+    return _like_search_messages(conn, session_id, namespace, query, limit, as_dict)
 
 
 def search_facts(
@@ -48,18 +52,21 @@ def _fts_search_messages(
     namespace: str,
     query: str,
     limit: int,
-) -> list[Message]:
+    as_dict: bool = False,
+) -> list[Message] | list[dict[str, str]]:
     """Search messages using FTS5."""
     # Escape FTS5 special characters
     safe_query = _escape_fts_query(query)
-    rows = conn.execute(
+    sql = (
         "SELECT m.* FROM messages m "
         "JOIN messages_fts fts ON m.id = fts.rowid "
         "WHERE fts.content MATCH ? AND m.session_id = ? AND m.namespace = ? "
-        "ORDER BY fts.rank LIMIT ?",
-        (safe_query, session_id, namespace, limit),
-    ).fetchall()
-    return [_row_to_message(r) for r in rows]
+        "ORDER BY fts.rank LIMIT ?"
+    )
+    params = (safe_query, session_id, namespace, limit)
+    if as_dict:
+        return fetch_message_dicts(conn, sql, params)
+    return [_row_to_message(r) for r in conn.execute(sql, params).fetchall()]
 
 
 def _fts_search_facts(
@@ -90,16 +97,19 @@ def _like_search_messages(
     namespace: str,
     query: str,
     limit: int,
-) -> list[Message]:
+    as_dict: bool = False,
+) -> list[Message] | list[dict[str, str]]:
     """Search messages using LIKE (fallback when FTS5 unavailable)."""
     pattern = f"%{query}%"
-    rows = conn.execute(
+    sql = (
         "SELECT * FROM messages "
         "WHERE session_id = ? AND namespace = ? AND content LIKE ? "
-        "ORDER BY id DESC LIMIT ?",
-        (session_id, namespace, pattern, limit),
-    ).fetchall()
-    return [_row_to_message(r) for r in rows]
+        "ORDER BY id DESC LIMIT ?"
+    )
+    params = (session_id, namespace, pattern, limit)
+    if as_dict:
+        return fetch_message_dicts(conn, sql, params)
+    return [_row_to_message(r) for r in conn.execute(sql, params).fetchall()]
 
 
 def _like_search_facts(
@@ -11,7 +11,7 @@ import json
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from .models import Fact, Message, Summary
 
@@ -62,6 +62,20 @@ CREATE INDEX IF NOT EXISTS idx_messages_session_ns ON messages(session_id, names
 CREATE INDEX IF NOT EXISTS idx_messages_ts ON messages(ts);
 CREATE INDEX IF NOT EXISTS idx_facts_session_ns ON facts(session_id, namespace);
 CREATE INDEX IF NOT EXISTS idx_summaries_session_ns ON summaries(session_id, namespace);
+-- Composite indexes for fetch_context's filter + order (not covering:
+-- content and the other selected columns are still read from the table).
+CREATE INDEX IF NOT EXISTS idx_facts_session_ns_rank ON facts(session_id, namespace, importance, id);
+CREATE INDEX IF NOT EXISTS idx_summaries_session_ns_scope ON summaries(session_id, namespace, scope, id);
+"""
+
+# Per-connection tuning for a small-transaction, write-per-turn workload.
+# Under WAL, synchronous=NORMAL keeps the database consistent; a power loss
+# can at worst roll back the last few commits.
+_CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA mmap_size=268435456;
 """
 
 
@@ -82,6 +96,7 @@ def connect(db_path: Path) -> sqlite3.Connection:
     conn = sqlite3.connect(str(db_path))
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_CONNECTION_PRAGMAS)
     conn.executescript(SCHEMA_SQL)
     conn.commit()
     return conn
@@ -156,19 +171,50 @@ def insert_message(
     return cur.lastrowid  # type: ignore[return-value]
 
 
+def insert_messages(
+    conn: sqlite3.Connection,
+    rows: Iterable[tuple[str, str, str, str, dict[str, Any] | None]],
+) -> int:
+    """Insert (session_id, namespace, role, content, metadata) rows in one transaction.
+
+    Returns the number of rows inserted.
+    """
+    ts = _now()
+    cur = conn.executemany(
+        "INSERT INTO messages (session_id, namespace, role, content, ts, metadata_json) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (session_id, namespace, role, content, ts,
+             json.dumps(metadata) if metadata else None)
+            for session_id, namespace, role, content, metadata in rows
+        ),
+    )
+    conn.commit()
+    return cur.rowcount
+
+
 def get_recent_messages(
     conn: sqlite3.Connection,
     session_id: str,
     namespace: str,
     limit: int = 50,
-) -> list[Message]:
-    """Get the most recent messages, ordered oldest-first."""
-    rows = conn.execute(
+    as_dict: bool = False,
+) -> list[Message] | list[dict[str, str]]:
+    """Get the most recent messages, ordered oldest-first.
+
+    With as_dict=True, returns model-ready {role, content} dicts directly.
+    """
+    sql = (
         "SELECT * FROM messages WHERE session_id = ? AND namespace = ? "
-        "ORDER BY id DESC LIMIT ?",
-        (session_id, namespace, limit),
-    ).fetchall()
+        "ORDER BY id DESC LIMIT ?"
+    )
+    params = (session_id, namespace, limit)
+    if as_dict:
+        rows = fetch_message_dicts(conn, sql, params)
+        rows.reverse()
+        return rows
 
+    rows = conn.execute(sql, params).fetchall()
     return [_row_to_message(r) for r in reversed(rows)]
 
 
@@ -295,6 +341,69 @@ def get_summary(
     return _row_to_summary(row) if row else None
 
 
+# ── Context ──
+
+# One round-trip for the rolling summary, top facts and recent messages.
+# Each branch carries its own sort keys because SQLite does not guarantee
+# that a subquery's ORDER BY survives into a compound SELECT.
+_CONTEXT_SQL = """
+SELECT * FROM (
+    SELECT 0 AS part, 'system' AS role, summary_text AS content, 0 AS k1, id AS k2
+    FROM summaries WHERE session_id = ? AND namespace = ? AND scope = 'rolling'
+    ORDER BY id DESC LIMIT ?
+)
+UNION ALL
+SELECT * FROM (
+    SELECT 1, 'system', fact_text, importance, id
+    FROM facts WHERE session_id = ? AND namespace = ? AND supersedes_id IS NULL
+    ORDER BY importance DESC, id DESC LIMIT ?
+)
+UNION ALL
+SELECT * FROM (
+    SELECT 2, role, content, 0, id
+    FROM messages WHERE session_id = ? AND namespace = ?
+    ORDER BY id DESC LIMIT ?
+)
+ORDER BY part, k1 DESC, k2 DESC
+"""
+
+
+def fetch_context(
+    conn: sqlite3.Connection,
+    session_id: str,
+    namespace: str,
+    max_recent: int,
+    max_facts: int,
+    want_summary: bool,
+) -> tuple[str | None, list[str], list[dict[str, str]]]:
+    """Fetch context parts in a single query.
+
+    Returns (rolling summary text or None, fact texts ordered by importance
+    then recency, recent messages oldest-first as {role, content} dicts).
+    """
+    rows = conn.execute(
+        _CONTEXT_SQL,
+        (session_id, namespace, 1 if want_summary else 0,
+         session_id, namespace, max(max_facts, 0),
+         session_id, namespace, max(max_recent, 0)),
+    ).fetchall()
+
+    # The outer ORDER BY sorts facts as get_facts does (importance DESC with
+    # NULLs last, then id DESC) and messages newest-first.
+    summary: str | None = None
+    facts: list[str] = []
+    messages: list[dict[str, str]] = []
+    for part, role, content, _, _ in rows:
+        if part == 2:
+            messages.append({"role": role, "content": content})
+        elif part == 1:
+            facts.append(content)
+        else:
+            summary = content
+    messages.reverse()
+    return summary, facts, messages
+
+
 # ── Events ──
 
 def add_event(conn: sqlite3.Connection, event_type: str, payload: dict | None = None):
@@ -379,6 +488,22 @@ def purge_summaries(
 
 # ── Row converters ──
 
+def _message_dict_row(_cursor: sqlite3.Cursor, row: tuple) -> dict[str, str]:
+    # Positions follow the messages table: id, session_id, namespace, role, content, ...
+    return {"role": row[3], "content": row[4]}
+
+
+def fetch_message_dicts(conn: sqlite3.Connection, sql: str, params: tuple) -> list[dict[str, str]]:
+    """Run a SELECT of full messages rows, returning {role, content} dicts.
+
+    Skips building Message objects on read paths that only need the
+    model-ready form.
+    """
+    cur = conn.cursor()
+    cur.row_factory = _message_dict_row
+    return cur.execute(sql, params).fetchall()
+
+
 def _row_to_message(row: sqlite3.Row) -> Message:
     meta = None
     if row["metadata_json"]:
@@ -0,0 +1,43 @@
+"""
+yaml_compat.py — Lazy PyYAML import and the fastest available safe loader.
+
+Depends on nothing else in this package, so the engine imports it
+alongside api.py instead of keeping its own copy.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=1)
+def import_yaml():
+    """Import PyYAML on first use (None if unavailable).
+
+    Deferred so code paths that never parse YAML never pay its import cost.
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None
+    return yaml
+
+
+def _require_yaml():
+    yaml = import_yaml()
+    if yaml is None:
+        raise ImportError("PyYAML is required: pip install pyyaml")
+    return yaml
+
+
+def safe_load(text: str) -> Any:
+    """yaml.safe_load, via libyaml's CSafeLoader when PyYAML was built with it."""
+    yaml = _require_yaml()
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def safe_dump(data: Any, **kwargs: Any) -> str:
+    """yaml.safe_dump, via libyaml's CSafeDumper when PyYAML was built with it."""
+    yaml = _require_yaml()
+    return yaml.dump(data, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper), **kwargs)
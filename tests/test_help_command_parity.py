@@ -1,45 +1,59 @@
 from __future__ import annotations
 
+import contextlib
+import importlib.machinery
+import importlib.util
+import io
 import json
+import os
 import re
-import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
 import unittest
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 CLI_PATH = REPO_ROOT / "engine" / "ai"
+_CMD_LINE_RE = re.compile(r"(?m)^ {2}(\S.*?) {2,}")
+
+
+@lru_cache(maxsize=1)
+def _load_cli():
+    """Import the extensionless engine/ai script as a module (once)."""
+    loader = importlib.machinery.SourceFileLoader("_scaffold_ai_cli", str(CLI_PATH))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module
 
 
 def _run_cli(*args: str) -> str:
-    result = subprocess.run(
-        [sys.executable, str(CLI_PATH), *args],
-        cwd=REPO_ROOT,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return result.stdout
+    """Run the CLI's main() in-process from REPO_ROOT and return its stdout."""
+    cli = _load_cli()
+    buf = io.StringIO()
+    saved_argv, saved_cwd = sys.argv, os.getcwd()
+    sys.argv = [str(CLI_PATH), *args]
+    try:
+        os.chdir(REPO_ROOT)
+        with contextlib.redirect_stdout(buf):
+            cli.main()
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise AssertionError(f"ai {' '.join(args)} exited with {e.code}:\n{buf.getvalue()}")
+    finally:
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+    return buf.getvalue()
 
 
 def _parse_cli_help_command_names(help_text: str) -> set[str]:
-    in_commands = False
-    names: set[str] = set()
-    for line in help_text.splitlines():
-        if line.strip() == "Commands:":
-            in_commands = True
-            continue
-        if not in_commands:
-            continue
-        if line.strip() == "Options:":
-            break
-        match = re.match(r"^\s{2}(.+?)\s{2,}", line)
-        if not match:
-            continue
-        spec = match.group(1).strip()
-        names.add(_command_name_from_spec(spec))
-    return names
+    start = help_text.find("\nCommands:\n")
+    if start < 0:
+        return set()
+    end = help_text.find("\nOptions:\n", start)
+    block = help_text[start:end] if end >= 0 else help_text[start:]
+    return {_command_name_from_spec(m.group(1)) for m in _CMD_LINE_RE.finditer(block)}
 
 
 def _parse_help_json() -> dict: